@@ -388,7 +388,7 @@ class CommandSequenceManager:
         :return: True if modifications were detected, otherwise False
         """
         try:
-            return not self.module_watcher.modified_files_queue.empty()
+            return bool(self.module_watcher.modified_files_queue)
         except AttributeError:
             raise CommandSequenceError('Cannot check if modifications were detected because a ' +
                                        'module watcher has not been created')
@@ -402,12 +402,7 @@ class CommandSequenceManager:
             raise CommandSequenceError('Cannot get modified module paths because a module ' +
                                        'watcher has not been created')
 
-        paths = []
-        while not self.module_watcher.modified_files_queue.empty():
-            path = self.module_watcher.modified_files_queue.get()
-            paths.append(path)
-
-        return paths
+        return self.module_watcher.get_modified_files()
 
     def set_auto_reload(self, enabled=True):
         """ Disable/ enable auto reloading of modules currently loaded in the manager.
@@ -11,8 +11,10 @@ StandaloneFileWatcher class was implemented. This class does not use any file wa
 libraries but instead compares the times a specific file was last modified.
 """
 from abc import ABC, abstractmethod
+from collections import deque
+import errno
 import threading
-import queue
+import time
 import os
 
 try:
@@ -33,21 +35,45 @@ class IFileWatcher(ABC):
 
     @abstractmethod
     def __init__(self):
+        # Paths of the watched files. Concrete classes must use a set or dict so that
+        # checking whether a path is already watched does not scan every watched path.
         self.watched_files = None
+        self.modified_files_queue = None
         self.is_watching = False
         self.thread = None
+        # Notified whenever a path is put into the queue so that callers can wait for
+        # modifications to be detected instead of polling the queue
+        self._queue_condition = threading.Condition()
 
     def run(self):
         """Run the watching process
 
-        This method creates a thread and starts the watching process by executing
-        the _run function from the relevant concrete class in the new thread.
+        This method starts the watching process. The watching is done by executing the
+        _run function from the relevant concrete class in a separate thread, which is
+        only created once there are files to watch.
         """
         if self.is_watching:
             raise CommandSequenceError(
                 'File watcher has already been started'
             )
 
+        self.is_watching = True
+        self._start_thread()
+
+    def _start_thread(self):
+        """Start the watching thread if it is needed
+
+        This method creates a thread and executes the _run function from the relevant
+        concrete class in it, if the watching process is running, there are files to
+        watch and the thread has not already been started. It is called by the concrete
+        classes whenever files are added for watching.
+        """
+        if not self.is_watching or not self.watched_files:
+            return
+
+        if self.thread and self.thread.is_alive():
+            return
+
         self.thread = threading.Thread(target=self._run)
         # Daemon must be set to True to ensure that the created
         # thread stops when the main one is stopped
@@ -57,17 +83,70 @@ class IFileWatcher(ABC):
     def stop(self):
         """Stop the watching process
 
-        This method stops the watching process by un-registering files
-        from watching and setting self.is_watching to False.
+        This method stops the watching process by setting self.is_watching to
+        False and un-registering files from watching.
         """
         if not self.is_watching:
             raise CommandSequenceError(
                 'Cannot stop file watcher as it has not been started'
             )
 
-        self.remove_watch(list(self.watched_files))
+        # Clear the flag before un-registering the files so that a watching thread
+        # woken up by the un-registration sees it and exits straight away
         self.is_watching = False
-        self.thread.join()
+        self.remove_watch(list(self.watched_files))
+        if self.thread:
+            self.thread.join()
+
+    def _put_modified_files(self, paths):
+        """Put the paths of modified files into the queue
+
+        This method puts the given paths into the queue and notifies any waiting
+        callers once that modifications have been detected, so that a batch of
+        modifications found together only wakes them up once.
+
+        :param paths: paths to the modified files
+        """
+        with self._queue_condition:
+            self.modified_files_queue.extend(paths)
+            self._queue_condition.notify_all()
+
+    def get_modified_files(self):
+        """Get the paths of the modified files
+
+        This method removes all the paths from the queue in one go and returns them.
+
+        :return: a list of paths to the modified files, in the order they were detected
+        """
+        with self._queue_condition:
+            paths = list(self.modified_files_queue)
+            self.modified_files_queue.clear()
+
+        return paths
+
+    def wait_until_size(self, size, timeout=None):
+        """Wait until the queue holds a given number of modified files
+
+        This method blocks until the queue contains at least the given number of
+        paths or until the timeout expires, whichever happens first.
+
+        :param size: number of paths that the queue must contain
+        :param timeout: maximum time in seconds to wait for (default None)
+        :return: True if the queue contains at least size paths, False otherwise
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        with self._queue_condition:
+            while len(self.modified_files_queue) < size:
+                if deadline is None:
+                    self._queue_condition.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return False
+                    self._queue_condition.wait(remaining)
+
+            return True
 
     @abstractmethod
     def add_watch(self, path_or_paths):
@@ -103,7 +182,7 @@ class InotifyFileWatcher(IFileWatcher):
         super().__init__()
         self.i = inotify.adapters.Inotify()
         self.watched_files = set()
-        self.modified_files_queue = queue.Queue()
+        self.modified_files_queue = deque()
 
         if path_or_paths:
             self.add_watch(path_or_paths)
@@ -114,9 +193,13 @@ class InotifyFileWatcher(IFileWatcher):
 
         This method waits for modification events from inotify and when it receives
         one, it puts the path of the file from where the event is coming from into
-        the queue. It puts the path only if it is not already in the queue.
+        the queue. It puts the path only if it is not already in the queue. Events
+        that inotify always reports, such as a watch being removed when its file is
+        deleted, are ignored.
         """
-        self.is_watching = True
+        # Bind names used for every received event to locals
+        in_close_write = inotify.constants.IN_CLOSE_WRITE
+        queued_paths = self.modified_files_queue
 
         for event in self.i.event_gen():
             if not self.is_watching:
@@ -126,9 +209,12 @@ class InotifyFileWatcher(IFileWatcher):
                 return
 
             if event is not None:
-                (_, _, path, _) = event
-                if path not in self.modified_files_queue.queue:
-                    self.modified_files_queue.put(path)
+                (header, _, path, _) = event
+                if not header.mask & in_close_write:
+                    continue
+
+                if path not in queued_paths:
+                    self._put_modified_files((path,))
 
     def add_watch(self, path_or_paths):
         """Register file(s) for watching
@@ -142,13 +228,24 @@ class InotifyFileWatcher(IFileWatcher):
         if not isinstance(path_or_paths, list):
             path_or_paths = [path_or_paths]
 
-        for path in path_or_paths:
-            if not isinstance(path, str):
-                path = str(path)
+        for path in map(os.fspath, path_or_paths):
+            if path in self.watched_files:
+                continue
+
+            try:
+                # Watch for the file being closed after writing rather than for every
+                # write to it, so that saving a file generates a single event
+                self.i.add_watch(path, inotify.constants.IN_CLOSE_WRITE)
+            except inotify.calls.InotifyError as error:
+                # Skip paths that do not exist or cannot be accessed, as the existence
+                # check that this replaced did
+                if error.errno in (errno.ENOENT, errno.ENOTDIR, errno.EACCES):
+                    continue
+                raise
 
-            if path not in self.watched_files and os.path.exists(path):
-                self.i.add_watch(path, inotify.constants.IN_MODIFY)
-                self.watched_files.add(path)
+            self.watched_files.add(path)
+
+        self._start_thread()
 
     def remove_watch(self, path_or_paths):
         """Un-register file(s) from watching
@@ -163,12 +260,13 @@ class InotifyFileWatcher(IFileWatcher):
         if not isinstance(path_or_paths, list):
             path_or_paths = [path_or_paths]
 
-        for path in path_or_paths:
-            if not isinstance(path, str):
-                path = str(path)
-
+        for path in map(os.fspath, path_or_paths):
             if path in self.watched_files:
-                self.i.remove_watch(path)
+                try:
+                    self.i.remove_watch(path)
+                except inotify.calls.InotifyError:
+                    # inotify has already removed the watch because the file was deleted
+                    pass
                 self.watched_files.remove(path)
 
 
@@ -177,10 +275,16 @@ class StandaloneFileWatcher(IFileWatcher):
 
     The class implements a file watcher, which allows one or more files to be watched
     for modification events, and details of the modified file(s) to be retrieved. It
-    does not use any file watching libraries but instead it constantly iterates through
+    does not use any file watching libraries but instead it periodically iterates through
     the files that it watches and compares the last modification files of each file.
     """
 
+    # Shortest and longest times in seconds to wait between successive scans of the
+    # watched files. The wait starts at the shortest time after the watching process
+    # starts or modifications are detected and doubles after each idle scan.
+    min_poll_interval = 0.005
+    poll_interval = 0.1
+
     def __init__(self, path_or_paths=None):
         """Initialise the file watcher.
 
@@ -190,30 +294,91 @@ class StandaloneFileWatcher(IFileWatcher):
         """
         super().__init__()
         self.watched_files = {}
-        self.modified_files_queue = queue.Queue()
+        # Snapshot of the watched paths that the watching thread iterates through. It
+        # is only rebuilt when files are added or removed rather than on every scan.
+        self._watched_paths = ()
+        self.modified_files_queue = deque()
+        # Held while files are added or removed and while the watching thread compares
+        # and updates modification times, so that a path removed from watching is never
+        # queued or added back by a scan that was already in progress
+        self._watch_lock = threading.Lock()
+        # Set when the watching process is stopped so that the thread does not have
+        # to wait for the rest of the poll interval before exiting
+        self._stop_event = threading.Event()
 
         if path_or_paths:
             self.add_watch(path_or_paths)
             self.run()
 
+    def run(self):
+        """Run the watching process
+
+        This method clears the stop event before the watching thread is started, so
+        that a stop() call made straight after it cannot be missed by the thread.
+        """
+        self._stop_event.clear()
+        super().run()
+
     def _run(self):
         """Watch for file modifications
 
-        This method constantly iterates through the list of watched files, comparing
-        the modification file times of each file. If it detects that the new
+        This method iterates through the list of watched files at an adaptive interval,
+        comparing the modification file times of each file. If it detects that the new
         time is not equal to the one that it has stored in the self.watched_files
-        dictionary, it puts the path of the file into the queue and updates the
-        modification time in the dictionary.
+        dictionary, it updates the modification time in the dictionary. The paths
+        of all the files found to be modified in a scan are put into the queue together.
+        The files are stat-ed without holding the watch lock, and the comparisons and
+        updates are then made under it.
         """
-        self.is_watching = True
+        # Bind names used for every watched file on every scan to locals
+        stat = os.stat
+        watch_lock = self._watch_lock
+        watched_files = self.watched_files
+        queued_paths = self.modified_files_queue
+        interval = self.min_poll_interval
 
         while self.is_watching:
-            for path, last_modified in list(self.watched_files.items()):
-                modified = os.stat(path).st_mtime
+            modified_times = []
+            for path in self._watched_paths:
+                try:
+                    modified_times.append((path, stat(path).st_mtime_ns))
+                except OSError:
+                    # The file was deleted or can no longer be read
+                    continue
+
+            modified_paths = []
+            with watch_lock:
+                for path, modified in modified_times:
+                    last_modified = watched_files.get(path)
+                    if last_modified is None:
+                        # The file was removed from watching during this scan
+                        continue
+
+                    if last_modified != modified and path not in queued_paths:
+                        modified_paths.append(path)
+                        watched_files[path] = modified
+
+                if modified_paths:
+                    self._put_modified_files(modified_paths)
+
+            if modified_paths:
+                # Files tend to be modified in bursts, so look again soon
+                interval = self.min_poll_interval
+            else:
+                interval = min(interval * 2, self.poll_interval)
+
+            self._stop_event.wait(interval)
+
+    def stop(self):
+        """Stop the watching process
+
+        This method wakes the watching thread so that it exits straight away
+        and then stops the watching process.
+        """
+        if self.is_watching:
+            self._stop_event.set()
 
-                if last_modified != modified and path not in self.modified_files_queue.queue:
-                    self.modified_files_queue.put(path)
-                    self.watched_files[path] = modified
+        super().stop()
 
     def add_watch(self, path_or_paths):
         """Add file(s) for watching
@@ -227,14 +392,23 @@ class StandaloneFileWatcher(IFileWatcher):
         if not isinstance(path_or_paths, list):
             path_or_paths = [path_or_paths]
 
-        for path in path_or_paths:
-            if not isinstance(path, str):
-                path = str(path)
+        with self._watch_lock:
+            for path in map(os.fspath, path_or_paths):
+                if path in self.watched_files:
+                    continue
+
+                try:
+                    last_modified = os.stat(path).st_mtime_ns
+                except OSError:
+                    # The file does not exist or cannot be stat-ed
+                    continue
 
-            if path not in self.watched_files and os.path.exists(path):
-                last_modified = os.stat(path).st_mtime
                 self.watched_files[path] = last_modified
 
+            self._watched_paths = tuple(self.watched_files)
+
+        self._start_thread()
+
     def remove_watch(self, path_or_paths):
         """Remove file(s) from watching
 
@@ -247,12 +421,12 @@ class StandaloneFileWatcher(IFileWatcher):
         if not isinstance(path_or_paths, list):
             path_or_paths = [path_or_paths]
 
-        for path in path_or_paths:
-            if not isinstance(path, str):
-                path = str(path)
+        with self._watch_lock:
+            for path in map(os.fspath, path_or_paths):
+                if path in self.watched_files:
+                    del self.watched_files[path]
 
-            if path in self.watched_files:
-                del self.watched_files[path]
+            self._watched_paths = tuple(self.watched_files)
 
 
 class FileWatcherFactory():
@@ -1,7 +1,78 @@
 """This module includes commonly used pytest fixtures that can be called from test functions."""
 
+import compileall
+from functools import lru_cache
+import os
+import shutil
+from pathlib import Path
+
 import pytest
 
+_TEST_RELOAD_MODULE = b"""provides = ['get_message']
+def get_message():
+    print('Executing get_message')
+    return 'World Hello'"""
+
+_WITH_DEPENDENCY_MODULE = b"""requires = ['test_reload']
+provides = ['generate_message']
+
+def generate_message():
+    print('Executing generate_message')
+    return 'Message: ' + get_message()"""
+
+
+class ContextObject():
+    """An example of a context object"""
+
+    __slots__ = ('value',)
+
+    def __init__(self, value):
+        self.value = value
+
+    def increment(self, val):
+        """Increments a given value by 1"""
+        return val + 1
+
+
+@pytest.fixture(scope="session")
+def context_object():
+    """
+    Test fixture for creating a simple container object that can be loaded into
+    the sequence manager context and accessed for test.
+    """
+    return ContextObject(255374)
+
+
+@pytest.fixture(scope="session")
+def shared_datadir_once(tmp_path_factory):
+    """
+    Test fixture for copying the shared test data directory into a temporary
+    directory once per test session. The modules in the copy are byte-compiled
+    so that the per-test hard-linked copies can be loaded without compiling
+    them again in every test.
+    """
+    original_datadir = Path(__file__).parent.joinpath('data')
+    datadir = tmp_path_factory.mktemp('datadir', numbered=False).joinpath('data')
+    shutil.copytree(original_datadir, datadir)
+    compileall.compile_dir(str(datadir), quiet=2)
+
+    return datadir
+
+
+@pytest.fixture
+def shared_datadir(shared_datadir_once, tmp_path):
+    """
+    Test fixture that overrides the pytest-datadir fixture of the same name. Instead
+    of copying the whole test data directory for every test, the files of the copy
+    made once per session are hard-linked into a per-test directory. Helpers that
+    modify files in place must break the link first so that the session copy is
+    not changed.
+    """
+    datadir = tmp_path.joinpath('data')
+    shutil.copytree(shared_datadir_once, datadir, copy_function=os.link)
+
+    return datadir
+
 
 @pytest.fixture
 def create_tmp_module_files(shared_datadir):
@@ -11,18 +82,27 @@ def create_tmp_module_files(shared_datadir):
     """
 
     test_reload_module = shared_datadir.joinpath('test_reload.py')
-    test_reload_module.write_text("""provides = ['get_message']
-def get_message():
-    print('Executing get_message')
-    return 'World Hello'""")
+    test_reload_module.write_bytes(_TEST_RELOAD_MODULE)
 
     with_dependency_module = shared_datadir.joinpath('with_dependency.py')
-    with_dependency_module.write_text("""requires = ['test_reload']
-provides = ['generate_message']
+    with_dependency_module.write_bytes(_WITH_DEPENDENCY_MODULE)
 
-def generate_message():
-    print('Executing generate_message')
-    return 'Message: ' + get_message()""")
+    return [test_reload_module, with_dependency_module]
+
+
+@pytest.fixture(scope="session")
+def shared_tmp_module_files(tmp_path_factory):
+    """
+    Test fixture for creating temporary module files once per session, which are shared
+    by the tests that register them with a file watcher but never modify them.
+    """
+    directory = tmp_path_factory.mktemp('tmp_modules')
+
+    test_reload_module = directory.joinpath('test_reload.py')
+    test_reload_module.write_bytes(_TEST_RELOAD_MODULE)
+
+    with_dependency_module = directory.joinpath('with_dependency.py')
+    with_dependency_module.write_bytes(_WITH_DEPENDENCY_MODULE)
 
     return [test_reload_module, with_dependency_module]
 
@@ -34,12 +114,14 @@ def create_paths(shared_datadir):
     the manager's load function to be loaded as modules.
     """
 
+    # Resolve each file or directory name only once, however many times it is requested
+    joinpath = lru_cache(maxsize=None)(shared_datadir.joinpath)
+
     def _create_paths(files_or_directories):
 
         if not isinstance(files_or_directories, list):
-            return shared_datadir.joinpath(files_or_directories)
+            return joinpath(files_or_directories)
 
-        return [shared_datadir.joinpath(
-            file_or_directory) for file_or_directory in files_or_directories]
+        return list(map(joinpath, files_or_directories))
 
     return _create_paths
@@ -6,34 +6,22 @@ from odin_sequencer import CommandSequenceError
 from src.odin_sequencer.adapter import CommandSequenceManagerAdapter
 import pytest
 
-@pytest.fixture
-def context_object():
-    """
-    Test fixture for creating a simple container object that can be loaded into
-    the sequence manager context and accessed for test.
-    """
+_PUT_BODY = json.dumps({'key': 'value'})
 
-    class ContextObject():
-        """An example of a context object"""
-
-        def __init__(self, value):
-            self.value = value
-
-        def increment(self, val):
-            """Increments a given value by 1"""
-            return val + 1
-
-    return ContextObject(255374)
 
 class TestCommandSequenceManagerAdapter:
 
-    @classmethod
-    def setup_class(cls):
-        cls.adapter = CommandSequenceManagerAdapter()
-        cls.command_sequencer_mock = MagicMock()
-        cls.adapter.command_sequencer = cls.command_sequencer_mock
-        cls.request = Mock()
-        cls.request.headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
+    @pytest.fixture(autouse=True)
+    def _setup(self):
+        """
+        Give each test its own adapter, command sequencer mock and request so
+        that no state is shared between tests.
+        """
+        self.adapter = CommandSequenceManagerAdapter()
+        self.command_sequencer_mock = MagicMock(spec_set=['get', 'set', '_add_context'])
+        self.adapter.command_sequencer = self.command_sequencer_mock
+        self.request = Mock()
+        self.request.headers = {'Accept': 'application/json', 'Content-Type': 'application/json'}
 
     def test_get_valid_path(self):
         self.command_sequencer_mock.get.return_value = {'key': 'value'}
@@ -44,8 +32,6 @@ class TestCommandSequenceManagerAdapter:
         assert type(response.data) == dict
         assert 'key' in response.data
 
-        self.command_sequencer_mock.get.reset_mock(return_value=True, side_effect=True)
-
     def test_get_invalid_path(self):
         invalid_path = 'invalid_path'
         self.command_sequencer_mock.get.side_effect = CommandSequenceError(
@@ -57,12 +43,9 @@ class TestCommandSequenceManagerAdapter:
         assert 'error' in response.data
         assert response.data['error'] == 'Invalid path: {}'.format(invalid_path)
 
-        self.command_sequencer_mock.get.reset_mock(return_value=True, side_effect=True)
-
     def test_put_valid_path(self):
         self.command_sequencer_mock.get.return_value = {'key': 'value'}
-        request_body = {'key': 'value'}
-        self.request.body = json.dumps(request_body)
+        self.request.body = _PUT_BODY
 
         response = self.adapter.put('', self.request)
 
@@ -71,14 +54,11 @@ class TestCommandSequenceManagerAdapter:
         assert 'key' in response.data
         self.command_sequencer_mock.get.assert_called_once_with('')
 
-        self.command_sequencer_mock.get.reset_mock(return_value=True, side_effect=True)
-
     def test_put_invalid_path(self):
         invalid_path = 'invalid_path'
         self.command_sequencer_mock.set.side_effect = CommandSequenceError(
             'Invalid path: {}'.format(invalid_path))
-        request_body = {'key': 'value'}
-        self.request.body = json.dumps(request_body)
+        self.request.body = _PUT_BODY
 
         response = self.adapter.put(invalid_path, self.request)
 
@@ -87,8 +67,6 @@ class TestCommandSequenceManagerAdapter:
         assert response.data['error'] == 'Invalid path: {}'.format(invalid_path)
         self.command_sequencer_mock.get.assert_not_called()
 
-        self.command_sequencer_mock.set.reset_mock(return_value=True, side_effect=True)
-
     @patch('src.odin_sequencer.adapter.json_decode')
     def test_put_bad_request(self, json_decode_mock):
         type_error_message = 'No JSON object could be decoded'
@@ -104,8 +82,6 @@ class TestCommandSequenceManagerAdapter:
             type_error_message)
         self.command_sequencer_mock.set.assert_not_called()
 
-        json_decode_mock.reset_mock(return_value=True, side_effect=True)
-
 
     def test_add_context(self, context_object):
 
@@ -113,4 +89,3 @@ class TestCommandSequenceManagerAdapter:
         self.adapter.add_context(obj_name, context_object)
         
         self.command_sequencer_mock._add_context.assert_called_once_with(obj_name, context_object)
-        self.command_sequencer_mock.get.reset_mock(return_value=True, side_effect=True)
@@ -1,3 +1,4 @@
+import re
 import time
 import pytest
 
@@ -7,9 +8,26 @@ from .testutils import (modify_test_reload_module_file, modify_test_reload_modul
                         modify_with_dependency_module_file, get_last_modified_file_time,
                         was_file_modified, await_queue_size)
 
+_ERR_WATCH_ALREADY = re.compile(r'A problem occurred while trying to start the Detect '
+                                r'Modifications process: Module watching has already been enabled')
+_ERR_WATCH_NO_MODULES = re.compile(r'A problem occurred while trying to start the Detect '
+                                   r'Modifications process: Cannot enable module watching '
+                                   r'when no modules are loaded')
+_ERR_WATCH_NOT_ENABLED = re.compile(r'A problem occurred while trying to stop the Detect '
+                                    r'Modifications process: Module watching cannot be '
+                                    r'disabled as it has not been enabled')
+_ERR_RELOAD_NO_MODULES = re.compile(r'Cannot start the reloading process as there are no '
+                                    r'sequence modules loaded')
+_ERR_RELOAD_WHILE_EXECUTING = re.compile(r'Cannot start the reloading process while a sequence '
+                                         r'is being executed')
+_ERR_EXECUTE_WHILE_EXECUTING = re.compile(r'Cannot execute command sequence while another one '
+                                          r'is being executed')
+_ERR_EXECUTE_WHILE_RELOADING = re.compile(r'Cannot execute command sequence while the reloading '
+                                          r'process is in progress')
 
 @pytest.fixture
 def create_command_sequencer(create_paths):
+    command_sequencers = []
 
     def _create_command_sequencer(files_or_directories=None):
         if not files_or_directories:
@@ -17,38 +35,50 @@ def create_command_sequencer(create_paths):
         else:
             paths = create_paths(files_or_directories)
 
-        return CommandSequencer(paths)
+        command_sequencer = CommandSequencer(paths)
+        command_sequencers.append(command_sequencer)
+        return command_sequencer
 
-    return _create_command_sequencer
+    yield _create_command_sequencer
 
-@pytest.fixture
-def context_object():
+    # Stop any module watcher that a test left running
+    for command_sequencer in command_sequencers:
+        if command_sequencer.manager.module_watching:
+            command_sequencer.manager.disable_module_watching()
+
+@pytest.fixture(scope="module")
+def shared_empty_sequencer():
     """
-    Test fixture for creating a simple container object that can be loaded into
-    the sequence manager context and accessed for test.
+    Test fixture for creating a single command sequencer without any loaded modules
+    that is shared by the tests in this module that need an empty sequencer.
     """
+    return CommandSequencer()
 
-    class ContextObject():
-        """An example of a context object"""
 
-        def __init__(self, value):
-            self.value = value
+@pytest.fixture
+def empty_sequencer(shared_empty_sequencer):
+    """
+    Test fixture that provides the shared empty sequencer after resetting the state
+    that the tests can change.
+    """
+    shared_empty_sequencer.process_tasks = []
+    shared_empty_sequencer.is_executing = False
+    shared_empty_sequencer.reload = False
+    shared_empty_sequencer.manager.context.clear()
 
-        def increment(self, val):
-            """Increments a given value by 1"""
-            return val + 1
+    return shared_empty_sequencer
 
-    return ContextObject(255374)
 
-def _await_execution_complete(command_sequencer):
-    for _ in range(15, 0, -1):
-        time.sleep(1)
-        if not command_sequencer.is_executing:
-            break
+def _await_execution_complete(command_sequencer, timeout=15):
+    deadline = time.monotonic() + timeout
+    delay = 0.005
+    while command_sequencer.is_executing and time.monotonic() < deadline:
+        time.sleep(delay)
+        delay = min(delay * 2, 0.2)
 
 
-def test_command_sequencer_with_no_paths(create_command_sequencer):
-    command_sequencer = create_command_sequencer()
+def test_command_sequencer_with_no_paths(empty_sequencer):
+    command_sequencer = empty_sequencer
 
     assert type(command_sequencer.manager) == CommandSequenceManager
     assert len(command_sequencer.path_or_paths) == 0
@@ -79,9 +109,9 @@ def test_get_param(create_command_sequencer):
     assert detect_module_modifications['detect_module_modifications'] is False
 
 
-def test_get_missing_param(create_command_sequencer):
+def test_get_missing_param(empty_sequencer):
     missing_param = 'missing_param'
-    command_sequencer = create_command_sequencer()
+    command_sequencer = empty_sequencer
 
     with pytest.raises(
             CommandSequenceError, match='Invalid path: {}'.format(missing_param)
@@ -100,9 +130,9 @@ def test_set_param(create_command_sequencer):
     command_sequencer.set('detect_module_modifications', False)
 
 
-def test_set_missing_param(create_command_sequencer):
+def test_set_missing_param(empty_sequencer):
     missing_param = 'missing_param'
-    command_sequencer = create_command_sequencer()
+    command_sequencer = empty_sequencer
 
     with pytest.raises(
             CommandSequenceError, match='Invalid path: {}'.format(missing_param)
@@ -110,9 +140,30 @@ def test_set_missing_param(create_command_sequencer):
         command_sequencer.set(missing_param, 0)
 
 
-def test_set_detect_module_modifications_to_true(create_command_sequencer):
-    file = 'basic_sequences.py'
-    command_sequencer = create_command_sequencer(file)
+@pytest.fixture(scope="module")
+def basic_sequencer(shared_datadir_once):
+    """
+    Test fixture for creating a single command sequencer, loaded with the basic sequences,
+    which is shared by the tests in this module that toggle module modification detection.
+    The module watcher it creates is reused each time detection is re-enabled.
+    """
+    return CommandSequencer(shared_datadir_once.joinpath('basic_sequences.py'))
+
+
+@pytest.fixture
+def watched_sequencer(basic_sequencer):
+    """
+    Test fixture that provides the shared basic sequencer and ensures that module
+    modification detection is disabled again once the test is complete.
+    """
+    yield basic_sequencer
+
+    if basic_sequencer.detect_module_modifications:
+        basic_sequencer.set_detect_module_modifications(False)
+
+
+def test_set_detect_module_modifications_to_true(watched_sequencer):
+    command_sequencer = watched_sequencer
 
     command_sequencer.set_detect_module_modifications(True)
     detect_module_modifications = command_sequencer.get('detect_module_modifications')[
@@ -121,38 +172,28 @@ def test_set_detect_module_modifications_to_true(create_command_sequencer):
     assert detect_module_modifications is True
     assert command_sequencer.manager.module_watching is True
 
-    command_sequencer.set_detect_module_modifications(False)
 
-
-def test_set_detect_module_modifications_to_true_when_already_enabled(create_command_sequencer):
-    file = 'basic_sequences.py'
-    command_sequencer = create_command_sequencer(file)
+def test_set_detect_module_modifications_to_true_when_already_enabled(watched_sequencer):
+    command_sequencer = watched_sequencer
     command_sequencer.set_detect_module_modifications(True)
 
     with pytest.raises(
-            CommandSequenceError, match='A problem occurred while trying to start the ' +
-                                        'Detect Modifications process: Module watching ' +
-                                        'has already been enabled'
+            CommandSequenceError, match=_ERR_WATCH_ALREADY
     ):
         command_sequencer.set_detect_module_modifications(True)
 
-    command_sequencer.set_detect_module_modifications(False)
-
 
-def test_set_detect_module_modifications_to_true_when_no_modules_loaded(create_command_sequencer):
-    command_sequencer = create_command_sequencer()
+def test_set_detect_module_modifications_to_true_when_no_modules_loaded(empty_sequencer):
+    command_sequencer = empty_sequencer
 
     with pytest.raises(
-            CommandSequenceError, match='A problem occurred while trying to start the ' +
-                                        'Detect Modifications process: Cannot enable ' +
-                                        'module watching when no modules are loaded'
+            CommandSequenceError, match=_ERR_WATCH_NO_MODULES
     ):
         command_sequencer.set_detect_module_modifications(True)
 
 
-def test_set_detect_module_modifications_to_false(create_command_sequencer):
-    file = 'basic_sequences.py'
-    command_sequencer = create_command_sequencer(file)
+def test_set_detect_module_modifications_to_false(watched_sequencer):
+    command_sequencer = watched_sequencer
     command_sequencer.set_detect_module_modifications(True)
 
     command_sequencer.set_detect_module_modifications(False)
@@ -163,13 +204,11 @@ def test_set_detect_module_modifications_to_false(create_command_sequencer):
     assert command_sequencer.manager.module_watching is False
 
 
-def test_set_detect_module_modifications_to_false_when_not_enabled(create_command_sequencer):
-    command_sequencer = create_command_sequencer()
+def test_set_detect_module_modifications_to_false_when_not_enabled(empty_sequencer):
+    command_sequencer = empty_sequencer
 
     with pytest.raises(
-            CommandSequenceError, match='A problem occurred while trying to stop the ' +
-                                        'Detect Modifications process: Module watching ' +
-                                        'cannot be disabled as it has not been enabled'
+            CommandSequenceError, match=_ERR_WATCH_NOT_ENABLED
     ):
         command_sequencer.set_detect_module_modifications(False)
 
@@ -185,8 +224,6 @@ def test_module_modifications_detected_when_no_modules_modified(shared_datadir,
 
     assert module_modifications_detected is False
 
-    command_sequencer.set_detect_module_modifications(False)
-
 
 def test_module_modifications_detected_when_modules_modified(shared_datadir,
                                                              create_command_sequencer,
@@ -201,12 +238,10 @@ def test_module_modifications_detected_when_modules_modified(shared_datadir,
 
     assert module_modifications_detected is True
 
-    command_sequencer.set_detect_module_modifications(False)
-
 
 def test_module_modifications_detected_detect_when_module_modifications_disabled(
-                                                            create_command_sequencer):
-    command_sequencer = create_command_sequencer()
+                                                            empty_sequencer):
+    command_sequencer = empty_sequencer
 
     module_modifications_detected = command_sequencer.module_modifications_detected()
 
@@ -241,24 +276,17 @@ def test_set_reload_to_true_when_detect_module_modifications_enabled(shared_data
     test_reload_module = tmp_files[0]
     last_modified_time = get_last_modified_file_time(test_reload_module)
     modify_test_reload_module_file(shared_datadir)
-    file_modified = was_file_modified(test_reload_module, last_modified_time)
-    if file_modified:
-        command_sequencer.set_detect_module_modifications(True)
-
-        with_dependency_module = tmp_files[1]
-        last_modified_time = get_last_modified_file_time(with_dependency_module)
-        modify_with_dependency_module_file(shared_datadir)
-        await_queue_size(command_sequencer.manager.module_watcher, 1)
-        command_sequencer.set_reload(True)
+    assert was_file_modified(test_reload_module, last_modified_time)
+    command_sequencer.set_detect_module_modifications(True)
 
-        seq_modules = command_sequencer.param_tree.get('sequence_modules')['sequence_modules']
-        assert command_sequencer.module_reload_failed is False
-        assert len(seq_modules[module_name]) == 1
-        assert new_seq_name not in seq_modules[module_name]
+    modify_with_dependency_module_file(shared_datadir)
+    await_queue_size(command_sequencer.manager.module_watcher, 1)
+    command_sequencer.set_reload(True)
 
-        command_sequencer.set_detect_module_modifications(False)
-    else:
-        pytest.fail(0)
+    seq_modules = command_sequencer.param_tree.get('sequence_modules')['sequence_modules']
+    assert command_sequencer.module_reload_failed is False
+    assert len(seq_modules[module_name]) == 1
+    assert new_seq_name not in seq_modules[module_name]
 
 
 def test_set_reload_to_true_when_module_failed_to_reload(shared_datadir, create_command_sequencer,
@@ -278,19 +306,13 @@ def test_set_reload_to_true_when_module_failed_to_reload(shared_datadir, create_
     test_reload_module = tmp_files[0]
     last_modified_time = get_last_modified_file_time(test_reload_module)
     modify_test_reload_module_file(shared_datadir)
-    file_modified = was_file_modified(test_reload_module, last_modified_time)
-
-    if file_modified:
-        command_sequencer.set_reload(True)
-
-        seq_modules = command_sequencer.param_tree.get('sequence_modules')['sequence_modules']
-        assert command_sequencer.module_reload_failed is False
-        assert len(seq_modules[module_name]) == 2
-        assert new_seq_name in seq_modules[module_name]
-    else:
-        pytest.fail()
+    assert was_file_modified(test_reload_module, last_modified_time)
+    command_sequencer.set_reload(True)
 
-    command_sequencer.set_detect_module_modifications(False)
+    seq_modules = command_sequencer.param_tree.get('sequence_modules')['sequence_modules']
+    assert command_sequencer.module_reload_failed is False
+    assert len(seq_modules[module_name]) == 2
+    assert new_seq_name in seq_modules[module_name]
 
 
 def test_set_reload_to_true_when_module_modified_with_syntax_error(shared_datadir,
@@ -310,15 +332,12 @@ def test_set_reload_to_true_when_module_modified_with_syntax_error(shared_datadi
         command_sequencer.set_reload(True)
     assert command_sequencer.module_reload_failed is True
 
-    command_sequencer.set_detect_module_modifications(False)
-
 
-def test_set_reload_to_true_when_no_modules_loaded(create_command_sequencer):
-    command_sequencer = create_command_sequencer()
+def test_set_reload_to_true_when_no_modules_loaded(empty_sequencer):
+    command_sequencer = empty_sequencer
 
     with pytest.raises(
-            CommandSequenceError, match='Cannot start the reloading process as there are ' +
-                                        'no sequence modules loaded'
+            CommandSequenceError, match=_ERR_RELOAD_NO_MODULES
     ):
         command_sequencer.set_reload(True)
 
@@ -329,151 +348,55 @@ def test_set_reload_to_true_while_sequence_is_executed(create_command_sequencer)
     command_sequencer.is_executing = True
 
     with pytest.raises(
-            CommandSequenceError, match='Cannot start the reloading process while a sequence ' +
-                                        'is being executed'
+            CommandSequenceError, match=_ERR_RELOAD_WHILE_EXECUTING
     ):
         command_sequencer.set_reload(True)
 
 
-def test_execute_sequence_string_list_param(create_command_sequencer):
-    file = 'sequences_with_list_params.py'
-    seq_name = 'print_str_list'
-    param_name = 'val'
-    path_to_seq = 'sequence_modules/sequences_with_list_params/' + seq_name
-    new_list_val = ['Hello', 'World']
-    data = {param_name: {'value': new_list_val}}
-    command_sequencer = create_command_sequencer(file)
-    command_sequencer.set(path_to_seq, data)
-
-    command_sequencer.execute_sequence(seq_name)
-    _await_execution_complete(command_sequencer)
-    command_sequencer.get_log_messsages('')
-    log_messages = command_sequencer.log_messages
-
-    assert log_messages[0][1] == str(new_list_val)
-
-
-def test_execute_sequence_int_list_param_int_values_passed_as_strings(create_command_sequencer):
-    file = 'sequences_with_list_params.py'
-    seq_name = 'print_int_list'
-    param_name = 'val'
-    path_to_seq = 'sequence_modules/sequences_with_list_params/' + seq_name
-    new_list_val = ['0', '1']
-    data = {param_name: {'value': new_list_val}}
-    command_sequencer = create_command_sequencer(file)
-    command_sequencer.set(path_to_seq, data)
-
-    command_sequencer.execute_sequence(seq_name)
-    _await_execution_complete(command_sequencer)
-    command_sequencer.get_log_messsages('')
-    log_messages = command_sequencer.log_messages
-
-    assert log_messages[0][1] == '[0, 1]'
-
-
-def test_execute_sequence_int_list_param_non_int_values_passed_as_strings(create_command_sequencer):
-    file = 'sequences_with_list_params.py'
-    seq_name = 'print_int_list'
-    param_name = 'val'
-    path_to_seq = 'sequence_modules/sequences_with_list_params/' + seq_name
-    new_list_val = ['False', 'test']
-    data = {param_name: {'value': new_list_val}}
-    command_sequencer = create_command_sequencer(file)
-    command_sequencer.set(path_to_seq, data)
-
-    with pytest.raises(
-            CommandSequenceError, match="Invalid list: {} - '{}' is not an int value".format(
-                param_name, new_list_val[0])
-    ):
-        command_sequencer.execute_sequence(seq_name)
-
-    command_sequencer.get_log_messsages('')
-    log_messages = command_sequencer.log_messages
-    assert command_sequencer.is_executing is False
-    assert len(log_messages) == 0
-
-
-def test_execute_sequence_float_list_param_float_values_passed_as_strings(create_command_sequencer):
-    file = 'sequences_with_list_params.py'
-    seq_name = 'print_float_list'
-    param_name = 'val'
-    path_to_seq = 'sequence_modules/sequences_with_list_params/' + seq_name
-    new_list_val = ['0.5', '2.7']
-    data = {param_name: {'value': new_list_val}}
-    command_sequencer = create_command_sequencer(file)
-    command_sequencer.set(path_to_seq, data)
-
-    command_sequencer.execute_sequence(seq_name)
-    _await_execution_complete(command_sequencer)
-    command_sequencer.get_log_messsages('')
-    log_messages = command_sequencer.log_messages
-
-    assert log_messages[0][1] == '[0.5, 2.7]'
-
-
-def test_execute_sequence_float_list_param_non_float_values_passed_as_strings(
-                                                                        create_command_sequencer):
-    file = 'sequences_with_list_params.py'
-    seq_name = 'print_float_list'
-    param_name = 'val'
-    path_to_seq = 'sequence_modules/sequences_with_list_params/' + seq_name
-    new_list_val = ['False', 'test']
-    data = {param_name: {'value': new_list_val}}
-    command_sequencer = create_command_sequencer(file)
-    command_sequencer.set(path_to_seq, data)
-
-    with pytest.raises(
-            CommandSequenceError, match="Invalid list: {} - '{}' is not a float value".format(
-                param_name, new_list_val[0])
-    ):
-        command_sequencer.execute_sequence(seq_name)
-
-    command_sequencer.get_log_messsages('')
-    log_messages = command_sequencer.log_messages
-    assert command_sequencer.is_executing is False
-    assert len(log_messages) == 0
-
-
-def test_execute_sequence_float_list_param_bool_values_passed_as_strings(
-                                                                    create_command_sequencer):
-    file = 'sequences_with_list_params.py'
-    seq_name = 'print_bool_list'
+@pytest.fixture(scope="module")
+def list_param_sequencer(shared_datadir_once):
+    """
+    Test fixture for creating a single command sequencer, loaded with the sequences that
+    have list parameters, which is shared by all the list parameter tests in this module.
+    """
+    return CommandSequencer(shared_datadir_once.joinpath('sequences_with_list_params.py'))
+
+
+@pytest.mark.parametrize("seq_name, new_list_val, expected_message, error", [
+    ('print_str_list', ['Hello', 'World'], "['Hello', 'World']", None),
+    ('print_int_list', ['0', '1'], '[0, 1]', None),
+    ('print_int_list', ['False', 'test'], None, 'not an int value'),
+    ('print_float_list', ['0.5', '2.7'], '[0.5, 2.7]', None),
+    ('print_float_list', ['False', 'test'], None, 'not a float value'),
+    ('print_bool_list', ['True', 'False'], '[True, False]', None),
+    ('print_bool_list', ['1', 'test'], None, 'not a bool value'),
+], ids=['str', 'int', 'non_int', 'float', 'non_float', 'bool', 'non_bool'])
+def test_execute_sequence_list_param(list_param_sequencer, seq_name, new_list_val,
+                                     expected_message, error):
     param_name = 'val'
     path_to_seq = 'sequence_modules/sequences_with_list_params/' + seq_name
-    new_list_val = ['True', 'False']
     data = {param_name: {'value': new_list_val}}
-    command_sequencer = create_command_sequencer(file)
+    command_sequencer = list_param_sequencer
+    command_sequencer.log_messages_deque.clear()
+    command_sequencer.is_executing = False
     command_sequencer.set(path_to_seq, data)
 
-    command_sequencer.execute_sequence(seq_name)
-    _await_execution_complete(command_sequencer)
-    command_sequencer.get_log_messsages('')
-    log_messages = command_sequencer.log_messages
-
-    assert log_messages[0][1] == '[True, False]'
-
+    if error:
+        with pytest.raises(
+                CommandSequenceError, match="Invalid list: {} - '{}' is {}".format(
+                    param_name, new_list_val[0], error)
+        ):
+            command_sequencer.execute_sequence(seq_name)
 
-def test_execute_sequence_float_list_param_non_bool_values_passed_as_strings(
-                                                                        create_command_sequencer):
-    file = 'sequences_with_list_params.py'
-    seq_name = 'print_bool_list'
-    param_name = 'val'
-    path_to_seq = 'sequence_modules/sequences_with_list_params/' + seq_name
-    new_list_val = ['1', 'test']
-    data = {param_name: {'value': new_list_val}}
-    command_sequencer = create_command_sequencer(file)
-    command_sequencer.set(path_to_seq, data)
-
-    with pytest.raises(
-            CommandSequenceError, match="Invalid list: {} - '{}' is not a bool value".format(
-                param_name, new_list_val[0])
-    ):
+        command_sequencer.get_log_messsages('')
+        assert command_sequencer.is_executing is False
+        assert len(command_sequencer.log_messages) == 0
+    else:
         command_sequencer.execute_sequence(seq_name)
+        _await_execution_complete(command_sequencer)
+        command_sequencer.get_log_messsages('')
 
-    command_sequencer.get_log_messsages('')
-    log_messages = command_sequencer.log_messages
-    assert command_sequencer.is_executing is False
-    assert len(log_messages) == 0
+        assert command_sequencer.log_messages[0][1] == expected_message
 
 
 def test_execute_sequence_while_sequence_is_executed(create_command_sequencer):
@@ -482,8 +405,7 @@ def test_execute_sequence_while_sequence_is_executed(create_command_sequencer):
     command_sequencer.is_executing = True
 
     with pytest.raises(
-            CommandSequenceError, match='Cannot execute command sequence while another one is ' +
-                                        'being executed'
+            CommandSequenceError, match=_ERR_EXECUTE_WHILE_EXECUTING
     ):
         command_sequencer.execute_sequence('basic_read')
 
@@ -494,17 +416,16 @@ def test_execute_sequence_while_reloading_process_in_progress(create_command_seq
     command_sequencer.reload = True
 
     with pytest.raises(
-            CommandSequenceError, match='Cannot execute command sequence while the reloading ' +
-                                        'process is in progress'
+            CommandSequenceError, match=_ERR_EXECUTE_WHILE_RELOADING
     ):
         command_sequencer.execute_sequence('basic_read')
 
     assert command_sequencer.is_executing is False
 
 
-def test_execute_sequence_with_missing_sequence(create_command_sequencer):
+def test_execute_sequence_with_missing_sequence(empty_sequencer):
     missing_sequence = 'basic_read'
-    command_sequencer = create_command_sequencer()
+    command_sequencer = empty_sequencer
 
     with pytest.raises(
             CommandSequenceError, match='Missing command sequence: {}'.format(missing_sequence)
@@ -514,9 +435,9 @@ def test_execute_sequence_with_missing_sequence(create_command_sequencer):
     assert command_sequencer.is_executing is False
 
 
-def test_start_process_task(create_command_sequencer):
+def test_start_process_task(empty_sequencer):
     uuid = 'uuid'
-    command_sequencer = create_command_sequencer()
+    command_sequencer = empty_sequencer
     
     command_sequencer.start_process_task(uuid)
     process_tasks = command_sequencer.process_tasks
@@ -524,9 +445,9 @@ def test_start_process_task(create_command_sequencer):
     assert process_tasks == [uuid]
 
 
-def test_finish_process_task(create_command_sequencer):
+def test_finish_process_task(empty_sequencer):
     uuid = 'uuid'
-    command_sequencer = create_command_sequencer()
+    command_sequencer = empty_sequencer
     command_sequencer.process_tasks = [uuid]
     
     command_sequencer.finish_process_task(uuid)
@@ -535,9 +456,9 @@ def test_finish_process_task(create_command_sequencer):
     assert process_tasks == []
 
 
-def test_finish_process_task_with_empty_process_tasks_list(create_command_sequencer):
+def test_finish_process_task_with_empty_process_tasks_list(empty_sequencer):
     uuid = 'uuid'
-    command_sequencer = create_command_sequencer()
+    command_sequencer = empty_sequencer
 
     with pytest.raises(
             CommandSequenceError, match='Empty process task list while trying to remove {}'.format(uuid)
@@ -556,7 +477,7 @@ def test_get_log_messages_with_no_last_message_timestamp(shared_datadir, create_
     command_sequencer.get_log_messsages('')
     log_messages = command_sequencer.log_messages
 
-    assert len(log_messages) == len(list(command_sequencer.log_messages_deque))
+    assert len(log_messages) == len(command_sequencer.log_messages_deque)
     assert log_messages[0][1] == 'Executing generate_message'
     assert log_messages[1][1] == 'Executing get_message'
 
@@ -568,7 +489,7 @@ def test_get_log_messages_with_last_message_timestamp(create_command_sequencer,
     command_sequencer = create_command_sequencer(tmp_files)
     command_sequencer.execute_sequence('generate_message')
     _await_execution_complete(command_sequencer)
-    last_message_timestamp = str(list(command_sequencer.log_messages_deque)[0][0])
+    last_message_timestamp = str(command_sequencer.log_messages_deque[0][0])
 
     command_sequencer.get_log_messsages(last_message_timestamp)
     log_messages = command_sequencer.log_messages
@@ -577,12 +498,12 @@ def test_get_log_messages_with_last_message_timestamp(create_command_sequencer,
     assert log_messages[0][1] == 'Executing get_message'
 
 
-def test_add_context(create_command_sequencer, context_object):
+def test_add_context(empty_sequencer, context_object):
 
-    command_sequencer = create_command_sequencer()
+    command_sequencer = empty_sequencer
     obj_name = 'context_object'
     command_sequencer._add_context(obj_name, context_object)
 
     assert obj_name in command_sequencer.manager.context
-    assert id(context_object) == id(command_sequencer.manager._get_context(obj_name))
+    assert context_object is command_sequencer.manager._get_context(obj_name)
     assert context_object.value == command_sequencer.manager._get_context(obj_name).value
@@ -10,65 +10,48 @@ from odin_sequencer import (FileWatcherFactory, InotifyFileWatcher,
 import odin_sequencer.watcher as watcher
 
 
-def test_create_file_watcher_with_inotify_as_name_without_paths():
+@pytest.fixture
+def no_inotify(monkeypatch):
     """
-    Test that an Inotify file watcher is created when the string value
-    inotify is passed to the create method of the factory class. Ensure
-    that the file watching process is not started when paths are not
-    passed to it.
+    Test fixture for simulating the import of the inotify library having failed.
+    The original value is restored automatically after the test.
     """
-    file_watcher = FileWatcherFactory.create_file_watcher(name='inotify')
-
-    assert isinstance(file_watcher, InotifyFileWatcher)
-    assert file_watcher.thread is None
-    assert len(file_watcher.watched_files) == 0
-    assert file_watcher.is_watching is False
+    monkeypatch.setattr(watcher, 'INOTIFY_IMPORTED', False)
 
 
-def test_create_file_watcher_with_inotify_as_name_with_paths(shared_datadir):
+@pytest.mark.parametrize('name, file_watcher_class', [
+    ('inotify', InotifyFileWatcher),
+    ('standalone', StandaloneFileWatcher),
+], ids=['inotify', 'standalone'])
+def test_create_file_watcher_with_name_without_paths(name, file_watcher_class):
     """
-    Test that an Inotify file watcher is created when the string value
-    inotify is passed to the create method of the factory class. Ensure
-    that the file watching process is  started when paths are passed to it.
+    Test that the requested file watcher is created when its name is passed
+    to the create method of the factory class. Ensure that the file watching
+    process is not started when paths are not passed to it.
     """
-    files = [shared_datadir.joinpath('basic_sequences.py'),
-             shared_datadir.joinpath('with_requires.py')]
-    file_watcher = FileWatcherFactory.create_file_watcher(name='inotify', path_or_paths=files)
-
-    assert isinstance(file_watcher, InotifyFileWatcher)
-    assert file_watcher.thread is not None
-    assert len(file_watcher.watched_files) == len(files)
-    assert file_watcher.is_watching is True
+    file_watcher = FileWatcherFactory.create_file_watcher(name=name)
 
-    file_watcher.stop()
-
-
-def test_create_file_watcher_with_standalone_as_name_without_paths():
-    """
-    Test that a Standalone file watcher is created when the string value
-    standalone is passed to the create method of the factory class. Ensure
-    that the file watching process is not started when paths are not
-    passed to it.
-    """
-    file_watcher = FileWatcherFactory.create_file_watcher(name='standalone')
-
-    assert isinstance(file_watcher, StandaloneFileWatcher)
+    assert isinstance(file_watcher, file_watcher_class)
     assert file_watcher.thread is None
     assert len(file_watcher.watched_files) == 0
     assert file_watcher.is_watching is False
 
 
-def test_create_file_watcher_with_standalone_as_name_with_paths(shared_datadir):
+@pytest.mark.parametrize('name, file_watcher_class', [
+    ('inotify', InotifyFileWatcher),
+    ('standalone', StandaloneFileWatcher),
+], ids=['inotify', 'standalone'])
+def test_create_file_watcher_with_name_with_paths(shared_datadir, name, file_watcher_class):
     """
-    Test that a Standalone file watcher is created when the string value
-    standalone is passed to the create method of the factory class. Ensure
-    that the file watching process is started when paths are passed to it.
+    Test that the requested file watcher is created when its name is passed
+    to the create method of the factory class. Ensure that the file watching
+    process is started when paths are passed to it.
     """
     files = [shared_datadir.joinpath('basic_sequences.py'),
              shared_datadir.joinpath('with_requires.py')]
-    file_watcher = FileWatcherFactory.create_file_watcher(name='standalone', path_or_paths=files)
+    file_watcher = FileWatcherFactory.create_file_watcher(name=name, path_or_paths=files)
 
-    assert isinstance(file_watcher, StandaloneFileWatcher)
+    assert isinstance(file_watcher, file_watcher_class)
     assert file_watcher.thread is not None
     assert len(file_watcher.watched_files) == len(files)
     assert file_watcher.is_watching is True
@@ -98,36 +81,23 @@ def test_create_file_watcher_with_inotify_imported_and_no_name():
     assert isinstance(file_watcher, InotifyFileWatcher)
 
 
-def test_create_file_watcher_without_inotify_imported_and_name():
+def test_create_file_watcher_without_inotify_imported_and_name(no_inotify):
     """
     Test that a Standalone file watcher is created when no string value
     is provided but the import of the inotify library was not successful.
     """
-    inotify_imported_old_value = watcher.INOTIFY_IMPORTED
-    watcher.INOTIFY_IMPORTED = False
     file_watcher = FileWatcherFactory.create_file_watcher()
 
     assert isinstance(file_watcher, StandaloneFileWatcher)
 
-    # Must set back to original value or otherwise it will be False
-    # in the other test modules despite inotify being imported
-    watcher.INOTIFY_IMPORTED = inotify_imported_old_value
-
 
-def test_create_file_watcher_with_inotify_as_name_and_without_inotify_imported():
+def test_create_file_watcher_with_inotify_as_name_and_without_inotify_imported(no_inotify):
     """
     Test that trying to create an Inotify file watcher when the import of
     the inotify library was not successful raises an error appropriately.
     """
-    inotify_imported_old_value = watcher.INOTIFY_IMPORTED
-    watcher.INOTIFY_IMPORTED = False
-
     with pytest.raises(
             CommandSequenceError, match='The requested file watcher cannot be created '
                                         'because the inotify module could not be found'
     ):
         FileWatcherFactory.create_file_watcher(name='inotify')
-
-    # Must set back to original value or otherwise it will be False
-    # in the other test modules despite inotify being imported
-    watcher.INOTIFY_IMPORTED = inotify_imported_old_value
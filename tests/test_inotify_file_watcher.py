@@ -3,79 +3,89 @@
 Some tests use the was_file_modified or await_queue_size method to ensure that
 a file was modified or that the file watcher, which runs in a separate thread,
 detects and puts details of the modified files into the queue before the assertions
-happen. Some tests also stop the file watcher if it has been started to ensure
-that the separate thread on which the file watcher runs is stopped.
+happen. The make_file_watcher fixture stops any file watcher that is still watching on
+teardown, to ensure that the separate thread on which the file watcher runs is stopped.
 """
 
 import pytest
 from odin_sequencer import InotifyFileWatcher, CommandSequenceError
 from .testutils import (modify_test_reload_module_file, modify_with_dependency_module_file,
-                        await_queue_size, get_last_modified_file_time, was_file_modified)
+                        modify_module_files, await_queue_size, get_last_modified_file_time,
+                        was_file_modified)
 
 
 @pytest.fixture
 def make_file_watcher():
-    """Test fixture for creating InotifyFileWatcher object"""
+    """
+    Test fixture for creating InotifyFileWatcher object. Any file watcher left watching
+    is stopped on teardown.
+    """
+    file_watchers = []
 
     def _make_file_watcher(path_or_paths=None):
-        return InotifyFileWatcher(path_or_paths)
+        file_watcher = InotifyFileWatcher(path_or_paths)
+        file_watchers.append(file_watcher)
+        return file_watcher
 
-    return _make_file_watcher
+    yield _make_file_watcher
 
+    for file_watcher in file_watchers:
+        if file_watcher.is_watching:
+            file_watcher.stop()
 
-def test_add_watch_with_file_path(make_file_watcher, create_tmp_module_files):
+
+@pytest.mark.parametrize('as_path', [
+    lambda module: module,
+    str,
+], ids=['path_object', 'string'])
+def test_add_watch_with_file_path(make_file_watcher, shared_tmp_module_files, as_path):
     """
-    Test that a path (in form of a Path object) to a specific file is added
+    Test that a path (in form of a Path object or a String) to a specific file is added
     to be watched.
     """
-    module = create_tmp_module_files[0]
+    module = shared_tmp_module_files[0]
     file_watcher = make_file_watcher()
-    file_watcher.add_watch(module)
+
+    file_watcher.add_watch(as_path(module))
 
     assert len(file_watcher.watched_files) == 1
+    assert str(module) in file_watcher.watched_files
 
 
-def test_add_watch_with_multiple_file_paths(make_file_watcher, create_tmp_module_files):
+def test_add_watch_with_multiple_file_paths(make_file_watcher, shared_tmp_module_files):
     """
     Test that paths (in form of Path objects) to specific files are added to be
     watched.
     """
-    tmp_files = create_tmp_module_files
+    tmp_files = shared_tmp_module_files
     file_watcher = make_file_watcher()
 
     file_watcher.add_watch(tmp_files)
 
-    assert len(file_watcher.watched_files) == len(tmp_files)
-    assert str(tmp_files[0]) in file_watcher.watched_files
-    assert str(tmp_files[1]) in file_watcher.watched_files
+    assert set(file_watcher.watched_files) == {str(path) for path in tmp_files}
 
 
-def test_add_watch_with_file_path_as_string(make_file_watcher, create_tmp_module_files):
-    """
-    Test that a path (in form of a String) to a specific file is added to be
-    watched.
-    """
-    module = str(create_tmp_module_files[0])
+def test_add_watch_with_missing_file_path(make_file_watcher, shared_datadir):
+    """Test that a path to a missing file is not added to be watched."""
     file_watcher = make_file_watcher()
 
-    file_watcher.add_watch(module)
+    file_watcher.add_watch(shared_datadir.joinpath('does_not_exist.py'))
 
-    assert len(file_watcher.watched_files) == 1
-    assert module in file_watcher.watched_files
+    assert len(file_watcher.watched_files) == 0
 
 
-def test_add_watch_with_missing_file_path(make_file_watcher, shared_datadir):
-    """Test that a path to a missing file is not added to be watched."""
+def test_add_watch_with_path_below_file(make_file_watcher, shared_datadir):
+    """Test that a path that has a file as one of its directories is not added to be watched."""
     file_watcher = make_file_watcher()
 
-    file_watcher.add_watch(shared_datadir.joinpath('does_not_exist.py'))
+    file_watcher.add_watch(shared_datadir.joinpath('basic_sequences.py', 'does_not_exist.py'))
 
     assert len(file_watcher.watched_files) == 0
 
 
-def test_add_watch_with_path_to_already_watched_file(make_file_watcher, create_tmp_module_files):
+def test_add_watch_with_path_to_already_watched_file(make_file_watcher, shared_tmp_module_files):
     """Test that a path to an already watched file is not added to be watched again."""
-    module = create_tmp_module_files[0]
+    module = shared_tmp_module_files[0]
     file_watcher = make_file_watcher()
 
     file_watcher.add_watch(module)
@@ -84,58 +94,45 @@ def test_add_watch_with_path_to_already_watched_file(make_file_watcher, create_t
     assert len(file_watcher.watched_files) == 1
 
 
-def test_remove_watch_with_file_path(make_file_watcher, create_tmp_module_files):
+@pytest.mark.parametrize('as_path', [
+    lambda module: module,
+    str,
+], ids=['path_object', 'string'])
+def test_remove_watch_with_file_path(make_file_watcher, shared_tmp_module_files, as_path):
     """
-    Test that a path (in form of a Path object) to a watched file is removed from
-    watching.
+    Test that a path (in form of a Path object or a String) to a watched file is removed
+    from watching.
     """
-    tmp_files = create_tmp_module_files
+    tmp_files = shared_tmp_module_files
     file_watcher = make_file_watcher()
     file_watcher.add_watch(tmp_files)
 
-    file_watcher.remove_watch(tmp_files[0])
+    file_watcher.remove_watch(as_path(tmp_files[0]))
 
     assert str(tmp_files[0]) not in file_watcher.watched_files
     assert len(file_watcher.watched_files) == len(tmp_files) - 1
 
 
-def test_remove_watch_with_multiple_file_paths(make_file_watcher, create_tmp_module_files):
+def test_remove_watch_with_multiple_file_paths(make_file_watcher, shared_tmp_module_files):
     """
     Test that paths (in form of Path objects) to watched files are removed from
     watching.
     """
-    tmp_files = create_tmp_module_files
+    tmp_files = shared_tmp_module_files
     file_watcher = make_file_watcher()
     file_watcher.add_watch(tmp_files)
 
     file_watcher.remove_watch(tmp_files)
 
-    assert str(tmp_files[0]) not in file_watcher.watched_files
-    assert str(tmp_files[1]) not in file_watcher.watched_files
     assert len(file_watcher.watched_files) == 0
 
 
-def test_remove_watch_with_file_path_as_string(make_file_watcher, create_tmp_module_files):
-    """
-    Test that a path (in form of a String) to a specific file is removed from
-    watching.
-    """
-    tmp_files = create_tmp_module_files
-    file_watcher = make_file_watcher()
-    file_watcher.add_watch(tmp_files)
-
-    file_watcher.remove_watch(str(tmp_files[0]))
-
-    assert str(tmp_files[0]) not in file_watcher.watched_files
-    assert len(file_watcher.watched_files) == len(tmp_files) - 1
-
-
-def test_remove_watch_with_not_watched_file_path(make_file_watcher, create_tmp_module_files):
+def test_remove_watch_with_not_watched_file_path(make_file_watcher, shared_tmp_module_files):
     """
     Test that a path to a non-watched file is not attempted to be removed from
     watching.
     """
-    module = create_tmp_module_files[0]
+    module = shared_tmp_module_files[0]
     file_watcher = make_file_watcher()
 
     file_watcher.remove_watch(module)
@@ -156,12 +153,12 @@ def test_stop_when_file_watcher_is_not_started(make_file_watcher):
         file_watcher.stop()
 
 
-def test_stop_when_file_watcher_is_started(make_file_watcher, create_tmp_module_files):
+def test_stop_when_file_watcher_is_started(make_file_watcher, shared_tmp_module_files):
     """
     Test that the file watcher can be successfully stopped when it has previously been
     started.
     """
-    tmp_files = create_tmp_module_files
+    tmp_files = shared_tmp_module_files
     file_watcher = make_file_watcher(tmp_files)
 
     file_watcher.stop()
@@ -170,12 +167,12 @@ def test_stop_when_file_watcher_is_started(make_file_watcher, create_tmp_module_
     assert file_watcher.is_watching is False
 
 
-def test_run_when_file_watcher_is_started(make_file_watcher, create_tmp_module_files):
+def test_run_when_file_watcher_is_started(make_file_watcher, shared_tmp_module_files):
     """
     Test that starting the file watcher when it has previously been started raises
     an error appropriately.
     """
-    tmp_files = create_tmp_module_files
+    tmp_files = shared_tmp_module_files
     file_watcher = make_file_watcher(tmp_files)
 
     with pytest.raises(
@@ -183,7 +180,29 @@ def test_run_when_file_watcher_is_started(make_file_watcher, create_tmp_module_f
     ):
         file_watcher.run()
 
-    file_watcher.stop()
+
+def test_run_when_no_files_are_watched(shared_datadir, make_file_watcher,
+                                       create_tmp_module_files):
+    """
+    Test that starting the file watcher without any watched files does not create a
+    thread until a file is added for watching, and that modifications of that file
+    are then detected.
+    """
+    module = create_tmp_module_files[0]
+    file_watcher = make_file_watcher()
+    file_watcher.run()
+
+    assert file_watcher.is_watching is True
+    assert file_watcher.thread is None
+
+    file_watcher.add_watch(module)
+
+    assert file_watcher.thread is not None
+
+    modify_test_reload_module_file(shared_datadir)
+    await_queue_size(file_watcher, 1)
+
+    assert len(file_watcher.modified_files_queue) == 1
 
 
 def test_empty_file_watcher(make_file_watcher):
@@ -198,20 +217,18 @@ def test_empty_file_watcher(make_file_watcher):
     assert file_watcher.is_watching is False
 
 
-def test_basic_file_watcher(make_file_watcher, create_tmp_module_files):
+def test_basic_file_watcher(make_file_watcher, shared_tmp_module_files):
     """
     Test that a file watcher initialised with a single path adds the
     path to the watch list and starts the watching process.
     """
-    module = create_tmp_module_files[0]
+    module = shared_tmp_module_files[0]
     file_watcher = make_file_watcher(module)
 
     assert file_watcher.thread is not None
     assert len(file_watcher.watched_files) == 1
     assert file_watcher.is_watching is True
 
-    file_watcher.stop()
-
 
 def test_file_watcher_when_watched_file_is_modified(shared_datadir, make_file_watcher,
                                                     create_tmp_module_files):
@@ -225,9 +242,7 @@ def test_file_watcher_when_watched_file_is_modified(shared_datadir, make_file_wa
     modify_test_reload_module_file(shared_datadir)
     await_queue_size(file_watcher, 1)
 
-    assert file_watcher.modified_files_queue.qsize() == 1
-
-    file_watcher.stop()
+    assert len(file_watcher.modified_files_queue) == 1
 
 
 def test_file_watcher_when_multiple_watched_files_are_modified(shared_datadir, make_file_watcher,
@@ -239,13 +254,40 @@ def test_file_watcher_when_multiple_watched_files_are_modified(shared_datadir, m
     tmp_files = create_tmp_module_files
     file_watcher = make_file_watcher(tmp_files)
 
-    modify_test_reload_module_file(shared_datadir)
-    modify_with_dependency_module_file(shared_datadir)
+    modify_module_files(shared_datadir)
     await_queue_size(file_watcher, 2)
 
-    assert file_watcher.modified_files_queue.qsize() == 2
+    assert len(file_watcher.modified_files_queue) == 2
+
+
+def test_wait_until_size_when_watched_file_is_modified(shared_datadir, make_file_watcher,
+                                                      create_tmp_module_files):
+    """
+    Test that waiting for the queue to reach a size returns True once a watched file
+    has been modified and False when the size is not reached before the timeout.
+    """
+    tmp_files = create_tmp_module_files
+    file_watcher = make_file_watcher(tmp_files)
+
+    modify_test_reload_module_file(shared_datadir)
+
+    assert file_watcher.wait_until_size(1, timeout=15) is True
+    assert file_watcher.wait_until_size(2, timeout=0.1) is False
 
-    file_watcher.stop()
+
+def test_get_modified_files(shared_datadir, make_file_watcher, create_tmp_module_files):
+    """
+    Test that getting the modified files returns the paths of all the modified files
+    and empties the queue.
+    """
+    tmp_files = create_tmp_module_files
+    file_watcher = make_file_watcher(tmp_files)
+
+    modify_module_files(shared_datadir)
+    await_queue_size(file_watcher, 2)
+
+    assert sorted(file_watcher.get_modified_files()) == sorted(map(str, tmp_files))
+    assert not file_watcher.modified_files_queue
 
 
 def test_file_watcher_when_non_watched_file_is_modified(shared_datadir, make_file_watcher,
@@ -262,14 +304,8 @@ def test_file_watcher_when_non_watched_file_is_modified(shared_datadir, make_fil
     file_watcher = make_file_watcher(test_reload_module)
 
     modify_with_dependency_module_file(shared_datadir)
-    file_modified = was_file_modified(with_dependency_module, last_modified_time)
-
-    if file_modified:
-        assert file_watcher.modified_files_queue.empty() is True
-        file_watcher.stop()
-    else:
-        file_watcher.stop()
-        pytest.fail()
+    assert was_file_modified(with_dependency_module, last_modified_time)
+    assert not file_watcher.modified_files_queue
 
 
 def test_file_watcher_when_previously_watched_file_is_modified(shared_datadir, make_file_watcher,
@@ -285,11 +321,23 @@ def test_file_watcher_when_previously_watched_file_is_modified(shared_datadir, m
 
     file_watcher.remove_watch(test_reload_module)
     modify_test_reload_module_file(shared_datadir)
-    file_modified = was_file_modified(test_reload_module, last_modified_time)
+    assert was_file_modified(test_reload_module, last_modified_time)
+    assert not file_watcher.modified_files_queue
 
-    if file_modified:
-        assert file_watcher.modified_files_queue.empty() is True
-        file_watcher.stop()
-    else:
-        file_watcher.stop()
-        pytest.fail()
+
+def test_file_watcher_when_watched_file_is_deleted(shared_datadir, make_file_watcher,
+                                                   create_tmp_module_files):
+    """
+    Test that the file watcher does not put the path to a watched file into the queue
+    when that file is deleted, while still detecting modifications to other watched files.
+    """
+    tmp_files = create_tmp_module_files
+    test_reload_module = tmp_files[0]
+    with_dependency_module = tmp_files[1]
+    file_watcher = make_file_watcher(tmp_files)
+
+    test_reload_module.unlink()
+    modify_with_dependency_module_file(shared_datadir)
+    await_queue_size(file_watcher, 1)
+
+    assert list(file_watcher.modified_files_queue) == [str(with_dependency_module)]
@@ -2,29 +2,66 @@
 
 """Tests for odin_sequencer package.
 
-Some tests use the was_file_modified or await_queue_size method to ensure that
-a file was modified or that the file watcher, which runs in a separate thread,
-detects and puts details of the modified files into the queue before the assertions
-happen. Some tests also disable the module watching if it has been enabled to ensure
-that the separate thread on which the module watcher runs is stopped.
+One test checks the modification time returned by modify_test_reload_module_file
+to ensure that the file was modified, and some tests use the await_queue_size method
+to ensure that the file watcher, which runs in a separate thread, detects and puts
+details of the modified files into the queue before the assertions happen. The
+make_seq_manager fixture disables module watching on teardown for any manager left
+watching, to ensure that the separate thread on which the module watcher runs is stopped.
 """
 
-import time
+import re
 import os
 import importlib.util
 import pytest
 
 from odin_sequencer import CommandSequenceManager, CommandSequenceError
-from .testutils import (modify_test_reload_module_file, modify_with_dependency_module_file,
-                        get_last_modified_file_time, was_file_modified, await_queue_size)
+from .testutils import (modify_test_reload_module_file, modify_module_files,
+                        get_last_modified_file_time, await_queue_size, count_module_files)
+
+_ERR_LOAD_SYNTAX = re.compile(r'Syntax error loading .*\/illegal_syntax.py')
+_ERR_LOAD_IMPORT = re.compile(r'Import error loading .*\/illegal_import.py')
+_ERR_LOAD_MISSING_MODULE = re.compile(r'Sequence module file .*\/does_not_exist.py not found')
+_ERR_LOAD_ALREADY_REGISTERED = re.compile(r"Unable to load sequence 'basic_read' from module "
+                                          r"'basic_sequences' as a sequence with the same name "
+                                          r"has already being registered")
+_ERR_LOAD_NO_DEFAULT = re.compile(r"'val' parameter in 'basic_seq' sequence does not have a "
+                                  r"default value")
+_ERR_LOAD_EMPTY_LIST = re.compile(r"'val' list parameter in 'basic_seq' sequence is empty")
+_ERR_LOAD_LIST_ELEMENT = re.compile(r"'val' list parameter in 'basic_seq' sequence contains a "
+                                    r"list element")
+_ERR_LOAD_HETEROGENEOUS_LIST = re.compile(r"'val' list parameter in 'basic_seq' sequence "
+                                          r"contains elements of different types")
+_ERR_RELOAD_MODULE_NOT_LOADED = re.compile(r'Cannot reload module basic_sequences as it is not '
+                                           r'loaded into the manager')
+_ERR_PROVIDE_MISMATCH = re.compile(r'provide_mismatch does not implement missing_sequence listed '
+                                   r'in its provided sequences')
+_ERR_MISSING_SEQUENCE = re.compile(r'Missing command sequence: basic_missing')
+_ERR_WATCH_NO_MODULES = re.compile(r'Cannot enable module watching when no modules are loaded')
+_ERR_WATCH_ALREADY = re.compile(r'Module watching has already been enabled')
+_ERR_WATCH_NOT_ENABLED = re.compile(r'Module watching cannot be disabled as it has not been '
+                                    r'enabled')
+_ERR_CHECK_NO_WATCHER = re.compile(r'Cannot check if modifications were detected because a '
+                                   r'module watcher has not been created')
+_ERR_PATHS_NO_WATCHER = re.compile(r'Cannot get modified module paths because a module watcher '
+                                   r'has not been created')
+_ERR_AUTO_RELOAD_ALREADY = re.compile(r'Auto reloading has already been enabled')
+_ERR_AUTO_RELOAD_NO_MODULES = re.compile(r'Cannot enable auto reloading due to: Cannot enable '
+                                         r'module watching when no modules are loaded')
+_ERR_AUTO_RELOAD_NOT_ENABLED = re.compile(r'Auto reloading cannot be disabled as it has not been '
+                                          r'enabled')
+_ERR_MISSING_REQUIRES = re.compile(r'Failed to resolve required command sequence modules')
+_ERR_MISSING_CONTEXT = re.compile(r'Manager context does not contain \S+')
 
 
 @pytest.fixture
 def make_seq_manager(create_paths):
     """
     Factory test fixture that allows a sequence manager to be created with
-    a particular file name or list of file names.
+    a particular file name or list of file names. Module watching is disabled
+    on teardown for any manager that a test left watching.
     """
+    managers = []
 
     def _make_seq_manager(file_or_files=None):
 
@@ -33,34 +70,63 @@ def make_seq_manager(create_paths):
         else:
             paths = create_paths(file_or_files)
 
-        return CommandSequenceManager(paths)
+        manager = CommandSequenceManager(paths)
+        managers.append(manager)
+        return manager
 
-    return _make_seq_manager
+    yield _make_seq_manager
 
+    for manager in managers:
+        if manager.module_watching:
+            manager.disable_module_watching()
 
-@pytest.fixture
-def context_object():
+
+@pytest.fixture(scope="module")
+def make_shared_seq_manager(shared_datadir_once):
     """
-    Test fixture for creating a simple container object that can be loaded into
-    the sequence manager context and accessed for test.
+    Factory test fixture that allows a sequence manager to be created with a particular
+    file name or list of file names, which is shared by the tests in this module that
+    do not modify the manager. A manager is only created once for each set of files.
     """
+    managers = {}
+
+    def _make_shared_seq_manager(file_or_files=None):
+
+        if not isinstance(file_or_files, list):
+            file_or_files = [file_or_files] if file_or_files else []
 
-    class ContextObject():
-        """An example of a context object"""
+        key = tuple(file_or_files)
+        manager = managers.get(key)
+        if manager is None:
+            paths = [shared_datadir_once.joinpath(file) for file in file_or_files]
+            manager = managers[key] = CommandSequenceManager(paths)
 
-        def __init__(self, value):
-            self.value = value
+        return manager
 
-        def increment(self, val):
-            """Increments a given value by 1"""
-            return val + 1
+    return _make_shared_seq_manager
 
-    return ContextObject(255374)
 
+@pytest.fixture(scope="module")
+def basic_sequences_manager(make_shared_seq_manager):
+    """
+    Test fixture for creating a sequence manager with the basic sequences module loaded,
+    which is shared by the tests in this module that do not modify the manager.
+    """
+    return make_shared_seq_manager('basic_sequences.py')
 
-def test_empty_manager(make_seq_manager):
+
+@pytest.fixture(scope="module")
+def num_context_data_modules(shared_datadir_once):
+    """
+    Test fixture for counting the sequence module files in the context_data directory once
+    for the tests in this module that load the directory.
+    """
+    return count_module_files(shared_datadir_once.joinpath('context_data'))
+
+
+def test_empty_manager(make_shared_seq_manager):
     """Test that a command sequence manager initialsed without any sequence files is empty."""
-    manager = make_seq_manager()
+    manager = make_shared_seq_manager()
 
     assert len(manager.modules) == 0
     assert len(manager.provides) == 0
@@ -69,12 +135,12 @@ def test_empty_manager(make_seq_manager):
     assert len(manager.sequence_modules) == 0
 
 
-def test_basic_manager_loaded(make_seq_manager):
+def test_basic_manager_loaded(basic_sequences_manager):
     """
     Test that a command sequence manager initialised with a single file exposes the
     correct sequence functions.
     """
-    manager = make_seq_manager('basic_sequences.py')
+    manager = basic_sequences_manager
     basic_return_value_seq_params = manager.sequence_modules['basic_sequences'][
         'basic_return_value']
 
@@ -90,68 +156,54 @@ def test_basic_manager_loaded(make_seq_manager):
     assert hasattr(manager, 'basic_write')
 
 
-def test_load_with_illegal_syntax(make_seq_manager):
-    """
-    Test that loading a sequence module with illegal python syntax raises an error
-    appropriately.
-    """
-    file_name = 'illegal_syntax.py'
-    with pytest.raises(
-            CommandSequenceError, match=r'Syntax error loading .*\/{}'.format(file_name)
-    ):
-        make_seq_manager(file_name)
-
-
-def test_load_with_bad_import(make_seq_manager):
-    """
-    Test that loading a module with a bad import statement raises an error
-    appropriately.
-    """
-    file_name = 'illegal_import.py'
-    with pytest.raises(
-            CommandSequenceError, match=r'Import error loading .*\/{}'.format(file_name)
-    ):
+@pytest.mark.parametrize('file_name, error', [
+    ('illegal_syntax.py', _ERR_LOAD_SYNTAX),
+    ('illegal_import.py', _ERR_LOAD_IMPORT),
+    ('does_not_exist.py', _ERR_LOAD_MISSING_MODULE),
+    ('missing_default_param_value.py', _ERR_LOAD_NO_DEFAULT),
+    ('empty_list_param.py', _ERR_LOAD_EMPTY_LIST),
+    ('list_param_contains_list_element.py', _ERR_LOAD_LIST_ELEMENT),
+    ('list_param_contains_heterogeneous_elements.py', _ERR_LOAD_HETEROGENEOUS_LIST),
+    ('provide_mismatch.py', _ERR_PROVIDE_MISMATCH),
+    ('with_requires.py', _ERR_MISSING_REQUIRES),
+], ids=['illegal_syntax', 'bad_import', 'missing_module', 'no_parameter_default_value',
+        'empty_list_parameter', 'list_parameter_with_list_element',
+        'list_parameter_with_heterogeneous_elements', 'mismatched_provide', 'missing_requires'])
+def test_load_with_invalid_module(make_seq_manager, file_name, error):
+    """
+    Test that loading a sequence module file that cannot be loaded or resolved raises an
+    error appropriately. The cases cover a module with illegal python syntax, a bad import
+    statement, a missing file, a sequence parameter without a default value, list
+    parameters that are empty or contain list or mixed type elements, a mismatched
+    provide statement and a requires statement without the matching module.
+    """
+    with pytest.raises(CommandSequenceError, match=error):
         make_seq_manager(file_name)
 
 
-def test_load_with_missing_module(make_seq_manager):
-    """
-    Test that loading a missing sequence module file into a manager raises an error
-    appropriately.
-    """
-    file_name = 'does_not_exist.py'
-    with pytest.raises(
-            CommandSequenceError, match=r'Sequence module file .*\/{} not found'.format(file_name)
-    ):
-        make_seq_manager(file_name)
-
-
-def test_load_with_directory_path(shared_datadir, make_seq_manager):
+def test_load_with_directory_path(make_seq_manager, num_context_data_modules):
     """
     Test that all sequence module files in a specified directory are loaded into the manager.
     """
-    directory = 'context_data'
-    manager = make_seq_manager(directory)
+    manager = make_seq_manager('context_data')
 
-    num_modules_in_dir = len(list(shared_datadir.joinpath(directory).glob('*.py')))
-    assert len(manager.modules) == num_modules_in_dir
-    assert len(manager.provides) == num_modules_in_dir
-    assert len(manager.requires) == num_modules_in_dir
+    assert len(manager.modules) == num_context_data_modules
+    assert len(manager.provides) == num_context_data_modules
+    assert len(manager.requires) == num_context_data_modules
 
 
-def test_load_with_module_and_directory_paths(shared_datadir, make_seq_manager):
+def test_load_with_module_and_directory_paths(make_seq_manager, num_context_data_modules):
     """
     Test that all specified module files and all module files inside a specified directory
     are loaded into the manager.
     """
     files = ['basic_sequences.py', 'with_requires.py']
-    directory = 'context_data'
-    manager = make_seq_manager(files + [directory])
+    manager = make_seq_manager(files + ['context_data'])
 
-    num_modules_in_dir = len(list(shared_datadir.joinpath(directory).glob('*.py')))
-    assert len(manager.modules) == len(files) + num_modules_in_dir
-    assert len(manager.provides) == len(files) + num_modules_in_dir
-    assert len(manager.requires) == len(files) + num_modules_in_dir
+    num_modules = len(files) + num_context_data_modules
+    assert len(manager.modules) == num_modules
+    assert len(manager.provides) == num_modules
+    assert len(manager.requires) == num_modules
 
 
 def test_load_with_missing_directory(shared_datadir, make_seq_manager):
@@ -171,77 +223,12 @@ def test_load_with_already_registered_sequence_name(make_seq_manager, create_pat
     loaded, raises an error appropriately.
     """
     module_name = 'basic_sequences'
-    seq_name = 'basic_read'
     manager = make_seq_manager(module_name + '.py')
 
-    with pytest.raises(
-            CommandSequenceError, match="Unable to load sequence '{}' from module '{}' as "
-                                        "a sequence with the same name has already being "
-                                        "registered".format(seq_name, module_name)
-    ):
+    with pytest.raises(CommandSequenceError, match=_ERR_LOAD_ALREADY_REGISTERED):
         manager.load(create_paths(module_name + '.py'))
 
 
-def test_load_with_sequence_that_has_no_paramater_default_value(make_seq_manager):
-    """
-    Test that loading a module file that has a sequence with no default paramater
-    value raises an error appropriately.
-    """
-    file_name = 'missing_default_param_value.py'
-    seq_name = 'basic_seq'
-    param_name = 'val'
-    with pytest.raises(
-            CommandSequenceError, match="'{}' parameter in '{}' sequence does not have a default "
-                                        "value".format(param_name, seq_name)
-    ):
-        make_seq_manager(file_name)
-
-
-def test_load_with_sequence_that_has_list_parameter_with_no_elements(make_seq_manager):
-    """
-    Test that loading a module file that has a sequence with a list parameter which is
-    empty, raises an error appropriately.
-    """
-    file_name = 'empty_list_param.py'
-    seq_name = 'basic_seq'
-    param_name = 'val'
-    with pytest.raises(
-            CommandSequenceError, match="'{}' list parameter in '{}' sequence is empty".format(
-                param_name, seq_name)
-    ):
-        make_seq_manager(file_name)
-
-
-def test_load_with_sequence_that_has_list_parameter_with_list_element(make_seq_manager):
-    """
-    Test that loading a module file that has a sequence with a list parameter which
-    contains a list element, raises an error appropriately.
-    """
-    file_name = 'list_param_contains_list_element.py'
-    seq_name = 'basic_seq'
-    param_name = 'val'
-    with pytest.raises(
-            CommandSequenceError, match="'{}' list parameter in '{}' sequence contains a "
-                                        "list element".format(param_name, seq_name)
-    ):
-        make_seq_manager(file_name)
-
-
-def test_load_with_sequence_that_has_list_parameter_with_heterogeneous_elements(make_seq_manager):
-    """
-    Test that loading a module file that has a sequence with a list parameter which
-    contains elements of different types, raises an error appropriately.
-    """
-    file_name = 'list_param_contains_heterogeneous_elements.py'
-    seq_name = 'basic_seq'
-    param_name = 'val'
-    with pytest.raises(
-            CommandSequenceError, match="'{}' list parameter in '{}' sequence contains "
-                                        "elements of different types".format(param_name, seq_name)
-    ):
-        make_seq_manager(file_name)
-
-
 def test_explicit_module_load(make_seq_manager, create_paths):
     """
     Test that a module file is loaded into the manager when the load function
@@ -270,52 +257,24 @@ def test_explicit_module_load_when_module_watching_enabled(make_seq_manager, cre
     assert str(file_paths[0]) in manager.module_watcher.watched_files
     assert str(file_paths[1]) in manager.module_watcher.watched_files
 
-    manager.disable_module_watching()
-
 
-def test_reload_with_module_name(shared_datadir, make_seq_manager, create_tmp_module_files):
+@pytest.mark.parametrize('reload_kwargs', [
+    lambda module: {'module_names': module.stem},
+    lambda module: {'file_paths': module},
+    lambda module: {'file_paths': str(module)},
+], ids=['module_name', 'file_path_object', 'file_path_as_string'])
+def test_reload_single_module(shared_datadir, make_seq_manager, create_tmp_module_files,
+                              reload_kwargs):
     """
-    Test that a specific loaded module is successfully reloaded when its module name
-    is provided to the reload function.
+    Test that a specific loaded module is successfully reloaded when its module name or
+    its path (in form of a Path object or a String) is provided to the reload function.
     """
     tmp_files = create_tmp_module_files
     module = tmp_files[0]
     manager = make_seq_manager(tmp_files)
 
     modify_test_reload_module_file(shared_datadir)
-    manager.reload(module_names=module.stem)
-    message = manager.generate_message()
-
-    assert message == 'Message: Hello World'
-
-
-def test_reload_with_file_path_object(shared_datadir, make_seq_manager, create_tmp_module_files):
-    """
-    Test that a specific loaded module is successfully reloaded when its path (in form
-    of a Path object) is provided to the reload function.
-    """
-    tmp_files = create_tmp_module_files
-    module = tmp_files[0]
-    manager = make_seq_manager(tmp_files)
-
-    modify_test_reload_module_file(shared_datadir)
-    manager.reload(file_paths=module)
-    message = manager.generate_message()
-
-    assert message == 'Message: Hello World'
-
-
-def test_reload_with_file_path_as_string(shared_datadir, make_seq_manager, create_tmp_module_files):
-    """
-    Test that a specific loaded module is successfully reloaded when its path (in form
-    of a String) is provided to the reload function.
-    """
-    tmp_files = create_tmp_module_files
-    module = tmp_files[0]
-    manager = make_seq_manager(tmp_files)
-
-    modify_test_reload_module_file(shared_datadir)
-    manager.reload(file_paths=str(module))
+    manager.reload(**reload_kwargs(module))
     message = manager.generate_message()
 
     assert message == 'Message: Hello World'
@@ -329,8 +288,7 @@ def test_reload_multiple_modules(shared_datadir, make_seq_manager, create_tmp_mo
     tmp_files = create_tmp_module_files
     manager = make_seq_manager(tmp_files)
 
-    modify_test_reload_module_file(shared_datadir)
-    modify_with_dependency_module_file(shared_datadir)
+    modify_module_files(shared_datadir)
     manager.reload(file_paths=tmp_files)
     message = manager.generate_message()
 
@@ -346,8 +304,7 @@ def test_reload_without_module_names_and_file_paths(shared_datadir, make_seq_man
     tmp_files = create_tmp_module_files
     manager = make_seq_manager(tmp_files)
 
-    modify_test_reload_module_file(shared_datadir)
-    modify_with_dependency_module_file(shared_datadir)
+    modify_module_files(shared_datadir)
     manager.reload()
     message = manager.generate_message()
 
@@ -374,14 +331,10 @@ def test_reload_with_not_loaded_module_name(make_seq_manager):
     Test that passing a name of a module, that has not been loaded, to the reload
     function raises the appropriate exception.
     """
-    module = 'basic_sequences'
     manager = make_seq_manager()
 
-    with pytest.raises(
-            CommandSequenceError, match='Cannot reload module {} as it is not loaded '
-                                        'into the manager'.format(module)
-    ):
-        manager.reload(module_names=module)
+    with pytest.raises(CommandSequenceError, match=_ERR_RELOAD_MODULE_NOT_LOADED):
+        manager.reload(module_names='basic_sequences')
 
 
 def test_reload_when_byte_compiled_file_of_module_is_deleted(shared_datadir, make_seq_manager,
@@ -403,100 +356,55 @@ def test_reload_when_byte_compiled_file_of_module_is_deleted(shared_datadir, mak
     assert message == 'Message: Hello World'
 
 
-def test_enable_module_watching(shared_datadir, make_seq_manager):
-    """ Test that module_watching is set to True and the loaded modules are watched."""
-    files = ['basic_sequences.py', 'with_requires.py']
-    basic_sequences_file_path = shared_datadir.joinpath(files[0])
-    with_requires_file_path = shared_datadir.joinpath(files[1])
-    manager = make_seq_manager(files)
-
-    manager.enable_module_watching()
-
-    assert manager.module_watcher is not None
-    assert manager.module_watching is True
-    assert len(manager.module_watcher.watched_files) == len(files)
-    assert str(basic_sequences_file_path) in manager.module_watcher.watched_files
-    assert str(with_requires_file_path) in manager.module_watcher.watched_files
-
-    manager.disable_module_watching()
-
-
-def test_enable_module_watching_when_no_modules_loaded(make_seq_manager):
-    """
-    Test that attempting to enable module watching when there are no modules
-    loaded in the manager raises an appropriate exception.
-    """
-    manager = make_seq_manager()
-
-    with pytest.raises(
-            CommandSequenceError, match='Cannot enable module watching when no modules are loaded'
-    ):
-        manager.enable_module_watching()
-
-
-def test_enable_module_watching_when_previously_enabled(shared_datadir, make_seq_manager):
-    """
-    Test that module_watching is set to True and the module watcher continues with watching
-    the loaded modules after being re-enabled.
-    """
-    files = ['basic_sequences.py', 'with_requires.py']
-    basic_sequences_file_path = shared_datadir.joinpath(files[0])
-    with_requires_file_path = shared_datadir.joinpath(files[1])
-    manager = make_seq_manager(files)
-    manager.enable_module_watching()
-    manager.disable_module_watching()
-
-    manager.enable_module_watching()
-
-    assert manager.module_watcher is not None
-    assert manager.module_watching is True
-    assert len(manager.module_watcher.watched_files) == len(files)
-    assert str(basic_sequences_file_path) in manager.module_watcher.watched_files
-    assert str(with_requires_file_path) in manager.module_watcher.watched_files
-
-    manager.disable_module_watching()
-
-
-def test_enable_module_watching_when_already_enabled(make_seq_manager):
-    """ Test that attempting to enable module watching while already enabled raises
-    an appropriate exception.
+def test_enable_and_disable_module_watching(shared_datadir, make_seq_manager):
+    """ Test that enabling module watching sets module_watching to True and watches the loaded
+    modules, that attempting to enable it again raises an appropriate exception, that
+    disabling it sets module_watching to False and no longer watches the modules, and that
+    re-enabling it watches the loaded modules again. The steps share one manager so that
+    the modules are only loaded once.
     """
     files = ['basic_sequences.py', 'with_requires.py']
+    file_paths = [str(shared_datadir.joinpath(file)) for file in files]
     manager = make_seq_manager(files)
-    manager.enable_module_watching()
 
-    with pytest.raises(
-            CommandSequenceError, match='Module watching has already been enabled'
-    ):
+    for _ in range(2):
         manager.enable_module_watching()
 
-    manager.disable_module_watching()
+        assert manager.module_watcher is not None
+        assert manager.module_watching is True
+        assert len(manager.module_watcher.watched_files) == len(files)
+        for file_path in file_paths:
+            assert file_path in manager.module_watcher.watched_files
 
+        with pytest.raises(
+                CommandSequenceError, match=_ERR_WATCH_ALREADY
+        ):
+            manager.enable_module_watching()
 
-def test_disable_module_watching(make_seq_manager):
-    """ Test that module_watching is set to False and the loaded modules are oo longer watched."""
-    files = ['basic_sequences.py', 'with_requires.py']
-    manager = make_seq_manager(files)
-    manager.enable_module_watching()
+        manager.disable_module_watching()
 
-    manager.disable_module_watching()
+        assert manager.module_watcher is not None
+        assert manager.module_watching is False
+        assert len(manager.module_watcher.watched_files) == 0
 
-    assert manager.module_watcher is not None
-    assert manager.module_watching is False
-    assert len(manager.module_watcher.watched_files) == 0
 
-
-def test_disable_module_watching_when_not_enabled(make_seq_manager):
-    """ Test that attempting to disable module watching when not enabled raises an appropriate
+@pytest.mark.parametrize('toggle_module_watching, error', [
+    (lambda manager: manager.enable_module_watching(), _ERR_WATCH_NO_MODULES),
+    (lambda manager: manager.disable_module_watching(), _ERR_WATCH_NOT_ENABLED),
+], ids=['enable', 'disable'])
+def test_toggle_module_watching_when_no_modules_loaded(make_shared_seq_manager,
+                                                       toggle_module_watching, error):
+    """
+    Test that attempting to enable module watching when there are no modules loaded in
+    the manager, or to disable it when it has not been enabled, raises an appropriate
     exception.
     """
-    manager = make_seq_manager()
+    manager = make_shared_seq_manager()
 
     with pytest.raises(
-            CommandSequenceError, match='Module watching cannot be disabled as it has not ' +
-                                        'been enabled'
+            CommandSequenceError, match=error
     ):
-        manager.disable_module_watching()
+        toggle_module_watching(manager)
 
 
 def test_module_modifications_detected_when_module_modified(shared_datadir, make_seq_manager,
@@ -512,8 +420,6 @@ def test_module_modifications_detected_when_module_modified(shared_datadir, make
 
     assert modifications_detected is True
 
-    manager.disable_module_watching()
-
 
 def test_module_modifications_detected_when_no_modules_modified(make_seq_manager):
     """ Test that it returns False when module watching is enabled but no modules are modified."""
@@ -525,8 +431,6 @@ def test_module_modifications_detected_when_no_modules_modified(make_seq_manager
 
     assert modifications_detected is False
 
-    manager.disable_module_watching()
-
 
 def test_module_modifications_detected_when_no_module_watcher_created(make_seq_manager):
     """ Test that attempting to check if module modifications were detected when a module
@@ -535,8 +439,7 @@ def test_module_modifications_detected_when_no_module_watcher_created(make_seq_m
     manager = make_seq_manager()
 
     with pytest.raises(
-            CommandSequenceError, match='Cannot check if modifications were detected because a ' +
-                                        'module watcher has not been created'
+            CommandSequenceError, match=_ERR_CHECK_NO_WATCHER
     ):
         manager.module_modifications_detected()
 
@@ -550,15 +453,12 @@ def test_get_modified_module_paths_when_module_modified(shared_datadir, make_seq
     tmp_file_paths = [str(tmp_file) for tmp_file in tmp_files]
     manager = make_seq_manager(tmp_files)
     manager.enable_module_watching()
-    modify_test_reload_module_file(shared_datadir)
-    modify_with_dependency_module_file(shared_datadir)
+    modify_module_files(shared_datadir)
     await_queue_size(manager.module_watcher, 2)
 
     paths = manager.get_modified_module_paths()
     assert paths == tmp_file_paths
 
-    manager.disable_module_watching()
-
 
 def test_get_modified_module_paths_when_no_modules_modified(make_seq_manager):
     """ Test that it returns an empty list when module watching is enabled but no modules
@@ -571,8 +471,6 @@ def test_get_modified_module_paths_when_no_modules_modified(make_seq_manager):
     paths = manager.get_modified_module_paths()
     assert len(paths) == 0
 
-    manager.disable_module_watching()
-
 
 def test_get_modified_module_paths_when_no_module_watcher_created(make_seq_manager):
     """ Test that attempting to get modified module paths when a module watcher is not
@@ -581,14 +479,17 @@ def test_get_modified_module_paths_when_no_module_watcher_created(make_seq_manag
     manager = make_seq_manager()
 
     with pytest.raises(
-            CommandSequenceError, match='Cannot get modified module paths because a module ' +
-            'watcher has not been created'
+            CommandSequenceError, match=_ERR_PATHS_NO_WATCHER
     ):
         manager.get_modified_module_paths()
 
 
-def test_set_auto_reload_to_true(make_seq_manager):
-    """ Test that auto_reload is set to True and module watching gets enabled."""
+def test_set_auto_reload_to_true_and_false(make_seq_manager):
+    """ Test that enabling auto reload sets auto_reload to True and enables module watching,
+    that attempting to enable it again raises an appropriate exception, and that disabling
+    it sets auto_reload to False but does not disable module watching. The steps share one
+    manager so that module watching is only started and stopped once.
+    """
     files = ['basic_sequences.py', 'with_requires.py']
     manager = make_seq_manager(files)
 
@@ -598,24 +499,17 @@ def test_set_auto_reload_to_true(make_seq_manager):
     assert manager.module_watcher is not None
     assert manager.module_watching is True
 
-    manager.disable_module_watching()
-
-
-def test_set_auto_reload_to_true_when_already_enabled(make_seq_manager):
-    """ Test that attempting to enable auto reload when already enabled raises an appropriate
-    exception.
-    """
-    files = ['basic_sequences.py', 'with_requires.py']
-    manager = make_seq_manager(files)
-
-    manager.set_auto_reload()
-
     with pytest.raises(
-            CommandSequenceError, match='Auto reloading has already been enabled'
+            CommandSequenceError, match=_ERR_AUTO_RELOAD_ALREADY
     ):
         manager.set_auto_reload()
 
-    manager.disable_module_watching()
+    manager.set_auto_reload(False)
+
+    assert manager.auto_reload is False
+    assert manager.module_watcher is not None
+    assert manager.module_watching is True
+    assert len(manager.module_watcher.watched_files) == len(files)
 
 
 def test_set_auto_reload_to_true_when_no_modules_loaded(make_seq_manager):
@@ -625,28 +519,11 @@ def test_set_auto_reload_to_true_when_no_modules_loaded(make_seq_manager):
     manager = make_seq_manager()
 
     with pytest.raises(
-            CommandSequenceError, match='Cannot enable auto reloading due to: Cannot enable ' +
-                                        'module watching when no modules are loaded'
+            CommandSequenceError, match=_ERR_AUTO_RELOAD_NO_MODULES
     ):
         manager.set_auto_reload()
 
 
-def test_set_auto_reload_to_false(make_seq_manager):
-    """ Test that auto_reload is set to False but module watching does not get disabled."""
-    files = ['basic_sequences.py', 'with_requires.py']
-    manager = make_seq_manager(files)
-    manager.set_auto_reload()
-
-    manager.set_auto_reload(False)
-
-    assert manager.auto_reload is False
-    assert manager.module_watcher is not None
-    assert manager.module_watching is True
-    assert len(manager.module_watcher.watched_files) == len(files)
-
-    manager.disable_module_watching()
-
-
 def test_set_auto_reload_to_false_when_not_enabled(make_seq_manager):
     """ Test that attempting to disable auto reload when not enabled raises an appropriate
     exception.
@@ -654,98 +531,72 @@ def test_set_auto_reload_to_false_when_not_enabled(make_seq_manager):
     manager = make_seq_manager()
 
     with pytest.raises(
-            CommandSequenceError, match='Auto reloading cannot be disabled as it has ' +
-                                        'not been enabled'
+            CommandSequenceError, match=_ERR_AUTO_RELOAD_NOT_ENABLED
     ):
         manager.set_auto_reload(False)
 
 
-def test_manager_multiple_files(make_seq_manager):
+def test_manager_multiple_files(make_shared_seq_manager):
     """
     Test that multiple module files can be
     loaded into the the sequence manager.
     """
     files = ['basic_sequences.py', 'no_provide.py']
-    manager = make_seq_manager(files)
+    manager = make_shared_seq_manager(files)
 
     assert len(manager.modules) == len(files)
     assert len(manager.provides) == len(files)
     assert len(manager.requires) == len(files)
 
 
-def test_sequence_no_provide(make_seq_manager):
+def test_sequence_no_provide(make_shared_seq_manager):
     """
     Test that a sequence file exports all functions for a sequence module without a
     'provides' statement.
     """
-    manager = make_seq_manager('no_provide.py')
+    manager = make_shared_seq_manager('no_provide.py')
 
     assert len(manager.provides) == 1
     assert manager.provides['no_provide'] == ['default_read', 'default_write']
 
 
-def test_sequence_mismatched_provide(make_seq_manager):
-    """
-    Test that loading a sequence file with a mismatched provide statement raises
-    the appropriate exception.
-    """
-    file_stem = 'provide_mismatch'
-    with pytest.raises(
-            CommandSequenceError, match='{} does not implement missing_sequence listed '
-                                        'in its provided sequences'.format(file_stem)
-    ):
-        make_seq_manager('{}.py'.format(file_stem))
-
-
-def test_sequence_with_requires(make_seq_manager):
+def test_sequence_with_requires(make_shared_seq_manager):
     """
     Test that loading a sequence file with a requires statement correctly resolves the
     required module.
     """
-    manager = make_seq_manager(['basic_sequences.py', 'with_requires.py'])
+    manager = make_shared_seq_manager(['basic_sequences.py', 'with_requires.py'])
 
     assert manager.requires['with_requires'] == ['basic_sequences']
 
 
-def test_sequence_no_requires(make_seq_manager):
+def test_sequence_no_requires(basic_sequences_manager):
     """
     Test that loading a sequence file without a requires statement correctly resolves to any
     empty requires value in the manager
     """
-    manager = make_seq_manager('basic_sequences.py')
+    manager = basic_sequences_manager
 
     assert manager.requires['basic_sequences'] == []
 
 
-def test_sequence_missing_requires(make_seq_manager):
-    """
-    Test that loading a sequence file with a requires statement but without the matching
-    module raises an exception.
-    """
-    file = 'with_requires.py'
-    with pytest.raises(
-            CommandSequenceError, match='Failed to resolve required command sequence modules'
-    ):
-        make_seq_manager(file)
-
-
-def test_file_load_explicit_resolve(make_seq_manager):
+def test_file_load_explicit_resolve(basic_sequences_manager):
     """
     Test that loading a single sequence module into a manager with an explicit resolve argument
     yields a correct initalised manager.
     """
-    manager = make_seq_manager('basic_sequences.py')
+    manager = basic_sequences_manager
 
     assert len(manager.modules) == 1
     assert 'basic_sequences' in manager.modules
 
 
-def test_execute_sequence(make_seq_manager):
+def test_execute_sequence(basic_sequences_manager):
     """
     Test that executing a sequence loaded from a file functions correctly, returning
     the appropriate value.
     """
-    manager = make_seq_manager('basic_sequences.py')
+    manager = basic_sequences_manager
 
     test_value = 90210
     ret_value = manager.execute('basic_return_value', test_value)
@@ -753,11 +604,18 @@ def test_execute_sequence(make_seq_manager):
     assert ret_value == test_value
 
 
-def test_execute_when_module_is_modified_while_auto_reload_enabled(shared_datadir, make_seq_manager,
-                                                                   create_tmp_module_files):
+@pytest.mark.parametrize('generate_message', [
+    lambda manager: manager.execute('generate_message'),
+    lambda manager: manager.generate_message(),
+], ids=['execute', 'attribute_func'])
+def test_sequence_when_module_is_modified_while_auto_reload_enabled(shared_datadir,
+                                                                    make_seq_manager,
+                                                                    create_tmp_module_files,
+                                                                    generate_message):
     """
-    Test that a module that has been modified while auto reloading
-    was enabled is reloaded when it gets executed.
+    Test that a module that has been modified while auto reloading was enabled is reloaded
+    when one of its sequences gets executed, either through the execute function or
+    through the manager attribute.
     """
     tmp_files = create_tmp_module_files
     manager = make_seq_manager(tmp_files)
@@ -765,11 +623,9 @@ def test_execute_when_module_is_modified_while_auto_reload_enabled(shared_datadi
     modify_test_reload_module_file(shared_datadir)
     await_queue_size(manager.module_watcher, 1)
 
-    message = manager.execute('generate_message')
+    message = generate_message(manager)
     assert message == 'Message: Hello World'
 
-    manager.disable_module_watching()
-
 
 def test_execute_when_modules_are_modified_while_auto_reload_enabled(shared_datadir,
                                                                      make_seq_manager,
@@ -781,22 +637,25 @@ def test_execute_when_modules_are_modified_while_auto_reload_enabled(shared_data
     tmp_files = create_tmp_module_files
     manager = make_seq_manager(tmp_files)
     manager.set_auto_reload()
-    modify_test_reload_module_file(shared_datadir)
-    modify_with_dependency_module_file(shared_datadir)
+    modify_module_files(shared_datadir)
     await_queue_size(manager.module_watcher, 2)
 
     message = manager.execute('generate_message')
     assert message == 'Message: Hello World - Hello World'
 
-    manager.disable_module_watching()
-
 
-def test_execute_when_module_is_modified_while_auto_reload_disabled(shared_datadir,
-                                                                    make_seq_manager,
-                                                                    create_tmp_module_files):
+@pytest.mark.parametrize('generate_message', [
+    lambda manager: manager.execute('generate_message'),
+    lambda manager: manager.generate_message(),
+], ids=['execute', 'attribute_func'])
+def test_sequence_when_module_is_modified_while_auto_reload_disabled(shared_datadir,
+                                                                     make_seq_manager,
+                                                                     create_tmp_module_files,
+                                                                     generate_message):
     """
-    Test that a module that has been modified while auto reloading
-    was disabled is not reloaded when it gets executed.
+    Test that a module that has been modified while auto reloading was disabled is not
+    reloaded when one of its sequences gets executed, either through the execute function
+    or through the manager attribute.
     """
     tmp_files = create_tmp_module_files
     test_reload_module = tmp_files[0]
@@ -804,36 +663,10 @@ def test_execute_when_module_is_modified_while_auto_reload_disabled(shared_datad
     manager = make_seq_manager(tmp_files)
     manager.set_auto_reload()
     manager.set_auto_reload(False)
-    modify_test_reload_module_file(shared_datadir)
-    file_modified = was_file_modified(test_reload_module, last_modified_time)
+    assert modify_test_reload_module_file(shared_datadir) > last_modified_time
 
-    if file_modified:
-        message = manager.execute('generate_message')
-        assert message == 'Message: World Hello'
-    else:
-        pytest.fail()
-
-    manager.disable_module_watching()
-
-
-def test_attribute_func_when_module_is_modified_while_auto_reload_enabled(shared_datadir,
-                                                                          make_seq_manager,
-                                                                          create_tmp_module_files):
-    """
-    Test that a module that has been modified while auto reloading was enabled is reloaded
-    when one of its functions is called through the manager attribute.
-    """
-    tmp_files = create_tmp_module_files
-    manager = make_seq_manager(tmp_files)
-    manager.set_auto_reload()
-    modify_test_reload_module_file(shared_datadir)
-    await_queue_size(manager.module_watcher, 1)
-
-    message = manager.generate_message()
-
-    assert message == 'Message: Hello World'
-
-    manager.disable_module_watching()
+    message = generate_message(manager)
+    assert message == 'Message: World Hello'
 
 
 def test_attribute_func_when_module_sequence_is_added_auto_reload_enabled(shared_datadir,
@@ -853,46 +686,15 @@ def test_attribute_func_when_module_sequence_is_added_auto_reload_enabled(shared
     assert basic_seq_value == [0, 1]
     assert manager.sequence_modules['test_reload']['basic_sequence']['value']['type'] == 'list-int'
 
-    manager.disable_module_watching()
-
-
-def test_attribute_func_when_module_is_modified_while_auto_reload_disabled(shared_datadir,
-                                                                           make_seq_manager,
-                                                                           create_tmp_module_files):
-    """
-    Test that a module that has been modified while auto reloading was disabled is not reloaded
-    when one of its functions is called through the manager attribute.
-    """
-    tmp_files = create_tmp_module_files
-    test_reload_module = tmp_files[0]
-    last_modified_time = get_last_modified_file_time(test_reload_module)
-    manager = make_seq_manager(tmp_files)
-    manager.set_auto_reload()
-    manager.set_auto_reload(False)
-    modify_test_reload_module_file(shared_datadir)
-    file_modified = was_file_modified(test_reload_module, last_modified_time)
-
-    if file_modified:
-        message = manager.generate_message()
-        assert message == 'Message: World Hello'
-    else:
-        pytest.fail()
-
-    manager.disable_module_watching()
-
 
-def test_execute_missing_sequence(make_seq_manager):
+def test_execute_missing_sequence(basic_sequences_manager):
     """
     Test that executing a missing sequence raises an exception correctly.
     the appropriate value.
     """
-    manager = make_seq_manager('basic_sequences.py')
-    missing_sequence = 'basic_missing'
-
-    with pytest.raises(
-            CommandSequenceError, match='Missing command sequence: {}'.format(missing_sequence)
-    ):
-        manager.execute(missing_sequence, 4567)
+    manager = basic_sequences_manager
+    with pytest.raises(CommandSequenceError, match=_ERR_MISSING_SEQUENCE):
+        manager.execute('basic_missing', 4567)
 
 
 def test_add_context_to_manager(make_seq_manager, context_object):
@@ -904,7 +706,7 @@ def test_add_context_to_manager(make_seq_manager, context_object):
     manager.add_context(obj_name, context_object)
 
     assert obj_name in manager.context
-    assert id(context_object) == id(manager._get_context(obj_name))
+    assert context_object is manager._get_context(obj_name)
     assert manager._get_context(obj_name).value == context_object.value
 
 
@@ -929,7 +731,7 @@ def test_access_context_in_sequence(make_seq_manager, context_object):
     assert context_access_seq_params['value']['value'] == 0
 
 
-def test_get_missing_context_object(make_seq_manager):
+def test_get_missing_context_object(make_seq_manager, context_object):
     """
     Test that attempting to access a missing context object raises an appropriate exception.
     """
@@ -938,6 +740,6 @@ def test_get_missing_context_object(make_seq_manager):
     manager.add_context(obj_name, context_object)
 
     with pytest.raises(
-            CommandSequenceError, match=r'Manager context does not contain \S+'
+            CommandSequenceError, match=_ERR_MISSING_CONTEXT
     ):
         manager.missing_context_obj()
@@ -6,86 +6,135 @@ It should not be imported by any module except for test code.
 
 import time
 import os
+import shutil
+
+_MODIFIED_TEST_RELOAD_MODULE = b"""provides = ['get_message', 'basic_sequence']
+def get_message():
+    return 'Hello World'
+
+def basic_sequence(value=[1]):
+    return value"""
+
+_TEST_RELOAD_MODULE_WITH_SYNTAX_ERROR = b"""provides = ['get_message', 'basic_sequence']
+dof get_message():
+    return 'Hello World'
+ 
+def basic_sequence(value=[1]):
+    return value"""
+
+_MODIFIED_WITH_DEPENDENCY_MODULE = b"""requires = ['test_reload']
+provides = ['generate_message']
+
+def generate_message():
+    return 'Message: ' + get_message() + ' - ' + get_message()"""
+
+
+def _unshare_file(path):
+    """
+    This method replaces the given file with a copy of itself if it is hard-linked
+    to another file, so that writing to it does not modify the linked file.
+    """
+    if path.exists() and os.stat(path).st_nlink > 1:
+        tmp_path = path.with_name(path.name + '.tmp')
+        shutil.copy2(path, tmp_path)
+        os.replace(tmp_path, path)
 
 
 def modify_test_reload_module_file(shared_datadir):
     """
-    This method modifies the content of the test_reload.py module.
-    There is a small delay to ensure that the modification does not
-    happen at the same time as the creation of the module.
+    This method modifies the content of the test_reload.py module and returns
+    its new modification time in nanoseconds.
     """
-    time.sleep(0.1)
     module = shared_datadir.joinpath('test_reload.py')
+    _unshare_file(module)
 
-    module.write_text("""provides = ['get_message', 'basic_sequence']
-def get_message():
-    return 'Hello World'
-
-def basic_sequence(value=[1]):
-    return value""")
+    module.write_bytes(_MODIFIED_TEST_RELOAD_MODULE)
+    return _advance_modified_time(module)
 
 
 def modify_test_reload_module_file_syntax_error(shared_datadir):
-    time.sleep(0.1)
+    """
+    This method modifies the content of the test_reload.py module so that it
+    contains a syntax error and returns its new modification time in nanoseconds.
+    """
     module = shared_datadir.joinpath('test_reload.py')
+    _unshare_file(module)
 
-    module.write_text("""provides = ['get_message', 'basic_sequence']
-dof get_message():
-    return 'Hello World'
- 
-def basic_sequence(value=[1]):
-    return value""")
+    module.write_bytes(_TEST_RELOAD_MODULE_WITH_SYNTAX_ERROR)
+    return _advance_modified_time(module)
 
 
 def modify_with_dependency_module_file(shared_datadir):
     """
-    This method modifies the content of the with_dependency.py module.
-    There is a small delay to ensure that the modification does not
-    happen at the same time as the creation of the module.
+    This method modifies the content of the with_dependency.py module and returns
+    its new modification time in nanoseconds.
     """
-    time.sleep(0.1)
     module = shared_datadir.joinpath('with_dependency.py')
+    _unshare_file(module)
 
-    module.write_text("""requires = ['test_reload']
-provides = ['generate_message']
+    module.write_bytes(_MODIFIED_WITH_DEPENDENCY_MODULE)
+    return _advance_modified_time(module)
 
-def generate_message():
-    return 'Message: ' + get_message() + ' - ' + get_message()""")
+
+def modify_module_files(shared_datadir):
+    """
+    This method modifies the content of both the test_reload.py and
+    with_dependency.py modules in one go and returns their new modification
+    times in nanoseconds, in that order.
+    """
+    return (modify_test_reload_module_file(shared_datadir),
+            modify_with_dependency_module_file(shared_datadir))
+
+
+def _advance_modified_time(path):
+    """
+    This method moves the modification time of the given file forward so that
+    the modification is visible straight away, even on filesystems with a coarse
+    timestamp granularity.
+
+    :param path: the path to the file
+    :return: the new modification time of the file in nanoseconds
+    """
+    now_ns = time.time_ns()
+    os.utime(path, ns=(now_ns, now_ns + 2_000_000_000))
+    return os.stat(path).st_mtime_ns
 
 
-def await_queue_size(module_watcher, expected_queue_size):
+def await_queue_size(module_watcher, expected_queue_size, timeout=15):
     """
-    This method Waits for the size of the queue to reach the given expected queue
-    size number. The loop exists if the number is not reached after 15 seconds.
-    param manager: manager object from where the module watcher and its queue can be acccessed
+    This method waits for the size of the queue to reach the given expected queue
+    size number. Rather than polling, it blocks on the watcher until enough paths
+    have been put into the queue. It returns if the number is not reached after
+    the timeout.
+    param module_watcher: module watcher whose queue needs to be waited on
     param expected_queue_size: the size that the queue needs to reach.
+    param timeout: the maximum time to wait in seconds (default 15)
     """
-    for _ in range(30, 0, -1):
-        if module_watcher.modified_files_queue.qsize() == expected_queue_size:
-            break
-        time.sleep(0.5)
+    module_watcher.wait_until_size(expected_queue_size, timeout)
 
 
 def get_last_modified_file_time(path):
     """This method gets the time that the given file was last modified.
     :param path: the path to the file
     """
-    return os.stat(path).st_mtime
+    return os.stat(path).st_mtime_ns
 
 
 def was_file_modified(path, last_modified_time):
     """This method checks whether the given file was modified.
 
     :param path: the path to the file
-    :param last_modified_time: the time the file was last modified
-    :return: return False if modification did not occur after 15 seconds,
-                otherwise return True
+    :param last_modified_time: the time (in nanoseconds) the file was last modified
+    :return: True if the file was modified since the given time, otherwise False
     """
-    for _ in range(30, 0, -1):
-        modified_time = get_last_modified_file_time(path)
-        if modified_time != last_modified_time:
-            return True
+    return get_last_modified_file_time(path) != last_modified_time
 
-        time.sleep(0.5)
 
-    return False
+def count_module_files(directory):
+    """This method counts the python module files in the given directory.
+
+    :param directory: the path to the directory
+    :return: the number of files in the directory with a .py extension
+    """
+    with os.scandir(directory) as entries:
+        return sum(1 for entry in entries if entry.name.endswith('.py') and entry.is_file())